@@ -1,9 +1,12 @@
 # Standard libraries
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
 import json
 import os
 
 # Add the current path since this is in the examples directory
 import sys
+
 sys.path.insert(1, os.getcwd())
 
 # 3rd party libraries
@@ -11,6 +14,7 @@ from dotenv import load_dotenv
 
 # Code
 from sdk.lib.numbers import Number
+from sdk.base.readers.utils.session import make_rpc_session
 from sdk.chains.bsc.configs import BscConfig
 from sdk.chains.bsc.readers.aggregator import BscAggregator
 
@@ -22,52 +26,81 @@ load_dotenv(".env.mainnet")
 ## Setup (mainnet) ##
 #####################
 bsc_config = BscConfig(
-    config_path="configs/bsc-mainnet",
-    rpc_uri=os.environ.get("BSC_RPC_URI")
+    config_path="configs/bsc-mainnet", rpc_uri=os.environ.get("BSC_RPC_URI")
 )
 bsc_aggregator = BscAggregator(bsc_config)
 
 #################
 ## Read prices ##
 #################
-cake_price = bsc_aggregator.get_price_sync('CAKE')
-print(f'CAKE Price: {float(cake_price)}')
+cake_price = bsc_aggregator.get_price_sync("CAKE")
+print(f"CAKE Price: {float(cake_price)}")
 
 amount_bnb = Number.from_ether(1.23)
 amount_busd = bsc_aggregator.convert_units_sync(
-    amount=amount_bnb,
-    from_symbol='BNB',
-    to_symbol='BUSD'
+    amount=amount_bnb, from_symbol="BNB", to_symbol="BUSD"
 )
-print(f'{float(amount_bnb)} BNB = {float(amount_busd)} BUSD')
+print(f"{float(amount_bnb)} BNB = {float(amount_busd)} BUSD")
+
+# Release the loop and session used by the sync calls
+bsc_aggregator.close()
 
 ##################
 ## Read reports ##
 ##################
-holdings_report = bsc_aggregator.get_holdings_report_sync()
-holdings_priced_report = bsc_aggregator.get_holdings_priced_report_sync()
-pcs_report = bsc_aggregator.get_protocol_report_sync('pancakeswap')
-pcs_priced_report = bsc_aggregator.get_protocol_priced_report_sync('pancakeswap')
-venus_report = bsc_aggregator.get_protocol_report_sync('venus')
-venus_priced_report = bsc_aggregator.get_protocol_priced_report_sync('venus')
-chain_report = bsc_aggregator.get_chain_report_sync()
-chain_priced_report = bsc_aggregator.get_chain_priced_report_sync()
+
+
+# Read all the reports concurrently over a single shared session
+async def main():
+    async with make_rpc_session() as session:
+        return await asyncio.gather(
+            bsc_aggregator.get_holdings_report_async(session),
+            bsc_aggregator.get_holdings_priced_report_async(session),
+            bsc_aggregator.get_protocol_report_async("pancakeswap", session),
+            bsc_aggregator.get_protocol_priced_report_async("pancakeswap", session),
+            bsc_aggregator.get_protocol_report_async("venus", session),
+            bsc_aggregator.get_protocol_priced_report_async("venus", session),
+            bsc_aggregator.get_chain_report_async(session),
+            bsc_aggregator.get_chain_priced_report_async(session),
+        )
+
+
+(
+    holdings_report,
+    holdings_priced_report,
+    pcs_report,
+    pcs_priced_report,
+    venus_report,
+    venus_priced_report,
+    chain_report,
+    chain_priced_report,
+) = asyncio.run(main())
 
 ##################
 ## Save reports ##
 ##################
+os.makedirs("reader-outputs", exist_ok=True)
+
+
 def save(data, filename):
-    if not os.path.exists('reader-outputs'):
-        os.mkdir('reader-outputs')
-
-    with open(f'reader-outputs/{filename}.json', 'w') as f:
-        json.dump(data, f, indent=2)
-
-save(holdings_report.dict(), 'holdings_report')
-save(holdings_priced_report.dict(), 'holdings_priced_report')
-save(pcs_report.dict(), 'pcs_report')
-save(pcs_priced_report.dict(), 'pcs_priced_report')
-save(venus_report.dict(), 'venus_report')
-save(venus_priced_report.dict(), 'venus_priced_report')
-save(chain_report.dict(), 'chain_report')
-save(chain_priced_report.dict(), 'chain_priced_report')
+    # Encode up front so the file is written in one go
+    # (reports are plain trees so skip the circular reference checks)
+    data_str = json.dumps(data, indent=2, check_circular=False)
+    with open(f"reader-outputs/{filename}.json", "w") as f:
+        f.write(data_str)
+
+
+reports = [
+    (holdings_report, "holdings_report"),
+    (holdings_priced_report, "holdings_priced_report"),
+    (pcs_report, "pcs_report"),
+    (pcs_priced_report, "pcs_priced_report"),
+    (venus_report, "venus_report"),
+    (venus_priced_report, "venus_priced_report"),
+    (chain_report, "chain_report"),
+    (chain_priced_report, "chain_priced_report"),
+]
+
+# Each report goes to its own file so the saves can overlap
+with ThreadPoolExecutor(max_workers=len(reports)) as executor:
+    list(executor.map(lambda report: save(report[0].dict(), report[1]), reports))
@@ -1,11 +1,18 @@
 # Standard libraries
-from typing import TypeVar, Generic, Mapping
+from typing import Any, TypeVar, Generic, Mapping
 from pathlib import Path
+import functools
 import os
 
 # 3rd party libraries
 import yaml
 
+# Use the C-accelerated loader when libyaml is available
+try:
+    from yaml import CSafeLoader as Loader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader as Loader  # type: ignore
+
 # Code
 from sdk.lib.models import FrozenGenericModel
 from .tokens import BasePricingConfig, TPricingConfig, GenericTokenConfig
@@ -22,6 +29,7 @@ class BaseConfig(FrozenGenericModel):
     # Environments
     rpc_uri: str
     wss_uri: str
+    read_over_wss: bool
     # Specialized by child config class
     ETH: str
     WETH: str
@@ -32,10 +40,32 @@ class BaseConfig(FrozenGenericModel):
     # Tokens config (mapping allows covariance)
     tokens: Mapping[str, GenericTokenConfig[BasePricingConfig]]
 
+    @property
+    def read_uri(self) -> str:
+        """
+        The endpoint for the readers, the websocket one if opted into.
+        """
+        return self.wss_uri if self.read_over_wss and self.wss_uri else self.rpc_uri
+
 
 TProtocolsConfig = TypeVar("TProtocolsConfig")
 
 
+@functools.lru_cache(maxsize=None)
+def _load_yaml(path: str, mtime: float) -> Any:
+    # The modified time is only part of the cache key to pick up file changes
+    with open(path, "r") as f:
+        return yaml.load(f, Loader)
+
+
+def _load_yaml_cached(path: Path) -> Any:
+    return _load_yaml(str(path), path.stat().st_mtime)
+
+
+# Validated fields of the static configs keyed by class, aliases and file versions
+_validated_fields: dict[tuple[Any, ...], dict[str, Any]] = {}
+
+
 class GenericChainConfig(BaseConfig, Generic[TPricingConfig, TProtocolsConfig]):
     """
     The generic chain config that allows the token and protocol
@@ -46,37 +76,71 @@ class GenericChainConfig(BaseConfig, Generic[TPricingConfig, TProtocolsConfig]):
     protocols: TProtocolsConfig
 
     def __init__(
-        self, config_path: str, rpc_uri: str, wss_uri: str, ETH: str, WETH: str
+        self,
+        config_path: str,
+        rpc_uri: str,
+        wss_uri: str,
+        ETH: str,
+        WETH: str,
+        validate: bool = False,
+        read_over_wss: bool = False,
     ):
         config_path_obj = Path(config_path)
-
-        with open(config_path_obj / "core.yaml", "r") as f:
-            core_config = yaml.load(f, yaml.Loader)
-
-        with open(config_path_obj / "tokens.yaml", "r") as f:
-            tokens_config = yaml.load(f, yaml.Loader)
+        with os.scandir(config_path_obj / "protocols") as entries:
+            protocols_paths = [
+                Path(entry.path)
+                for entry in entries
+                # Skip if not a yaml file
+                if entry.name.endswith(".yaml")
+            ]
+
+        # The yaml files are trusted and static, so only validate each version once
+        paths = [config_path_obj / "core.yaml", config_path_obj / "tokens.yaml"]
+        cache_key = (
+            type(self),
+            ETH,
+            WETH,
+            *((str(path), path.stat().st_mtime) for path in paths + protocols_paths),
+        )
+        validated_fields = _validated_fields.get(cache_key)
+        if validated_fields is not None and not validate:
+            # Same as pydantic's `construct` since the nested models are immutable
+            object.__setattr__(
+                self,
+                "__dict__",
+                {
+                    **validated_fields,
+                    "rpc_uri": rpc_uri,
+                    "wss_uri": wss_uri,
+                    "read_over_wss": read_over_wss,
+                },
+            )
+            object.__setattr__(self, "__fields_set__", set(self.__fields__.keys()))
+            self._init_private_attributes()
+            return
+
+        core_config = _load_yaml_cached(config_path_obj / "core.yaml")
+
+        # Copy since the cached dict is shared across instances
+        tokens_config = dict(_load_yaml_cached(config_path_obj / "tokens.yaml"))
 
         # Map the ETH token to WETH
         tokens_config[ETH] = tokens_config[WETH]
 
-        protocols_configs = {}
-        for file_name in os.listdir(config_path_obj / "protocols"):
-            split_file_name = file_name.split(".")
-
-            # Skip if not a yaml file
-            if split_file_name[-1] != "yaml":
-                continue
-
-            protocol_name = split_file_name[0]
-            with open(config_path_obj / "protocols" / file_name, "r") as f:
-                protocols_configs[protocol_name] = yaml.load(f, yaml.Loader)
+        protocols_configs = {
+            file_path.stem: _load_yaml_cached(file_path)
+            for file_path in protocols_paths
+        }
 
         super().__init__(
             rpc_uri=rpc_uri,
             wss_uri=wss_uri,
+            read_over_wss=read_over_wss,
             ETH=ETH,
             WETH=WETH,
             **core_config,
             tokens=tokens_config,
             protocols=protocols_configs,
         )
+
+        _validated_fields[cache_key] = dict(self.__dict__)
@@ -1,5 +1,5 @@
 # Standard libraries
-from typing import Literal
+from typing import Literal, Optional
 
 # Code
 from sdk.lib.models import FrozenModel
@@ -12,3 +12,7 @@ class ChainlinkPricingConfig(FrozenModel):
 
     id: Literal["chainlink"]
     address: str
+    # Immutable on the oracle, read once on first use if not configured
+    decimals: Optional[int] = None
+    # Max seconds since the last update before the answer is stale, if checked
+    heartbeat: Optional[int] = None
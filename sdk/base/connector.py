@@ -1,6 +1,11 @@
 # 3rd party libraries
 from web3 import Web3
 
+# Constants
+WEBSOCKET_PREFIXES = ("wss://", "ws://")
+HTTP_PREFIXES = ("https://", "http://")
+WEBSOCKET_KWARGS = {"ping_interval": 10}
+
 
 class BaseConnector:
     """
@@ -26,12 +31,10 @@ class BaseConnector:
         if not uri:
             raise ValueError("Endpoint cannot be empty.")
 
-        if uri[:3] == "wss":
-            return Web3(
-                Web3.WebsocketProvider(uri, websocket_kwargs={"ping_interval": 10})
-            )
+        if uri.startswith(WEBSOCKET_PREFIXES):
+            return Web3(Web3.WebsocketProvider(uri, websocket_kwargs=WEBSOCKET_KWARGS))
 
-        if uri[:4] == "http":
+        if uri.startswith(HTTP_PREFIXES):
             return Web3(Web3.HTTPProvider(uri))
 
         # Raise exception if uri connection type is not supported
@@ -1,14 +1,73 @@
 # Standard libraries
-from typing import Any, Type
+from typing import Any, Callable, Optional, Type, cast
+from collections import Counter
+import functools
 
 # 3rd party libraries
+from eth_abi.encoding import TupleEncoder
+from eth_abi.exceptions import EncodingError
+from eth_abi.registry import registry
+from eth_typing import HexStr
+from eth_utils import encode_hex, function_abi_to_4byte_selector
+from web3._utils.abi import get_abi_input_types, merge_args_and_kwargs
+from web3._utils.contracts import encode_abi
 from web3.contract import Contract
+from web3.types import ABIFunction
 import web3
 
 # Code
 from sdk.lib.utils import load_abi
 
 
+# Provider-less web3 instance only used to build contract factories
+_W3 = web3.Web3()
+
+
+@functools.lru_cache(maxsize=None)
+def _make_contract(dir_path: str, abi_path: str) -> Type[Contract]:
+    # Load the ABI from the file's directory
+    abi = load_abi(dir_path, abi_path)
+
+    # Load the address-less contract object
+    contract: Type[Contract] = _W3.eth.contract(abi=abi)
+    return contract
+
+
+# Function abi, hex selector and arguments encoder (a `TupleEncoder`)
+FunctionInfo = tuple[ABIFunction, HexStr, Callable[[Any], bytes]]
+
+
+def _make_function_info(fn_abi: ABIFunction) -> FunctionInfo:
+    # The arguments encoder is specialized to the function's input types
+    encoder: Callable[[Any], bytes] = TupleEncoder(
+        encoders=[
+            registry.get_encoder(type_str) for type_str in get_abi_input_types(fn_abi)
+        ]
+    )
+    selector = function_abi_to_4byte_selector(cast(dict[str, Any], fn_abi))
+    return fn_abi, encode_hex(selector), encoder
+
+
+@functools.lru_cache(maxsize=None)
+def _get_function_infos(dir_path: str, abi_path: str) -> dict[str, FunctionInfo]:
+    # Keyed by the abi's location like the contract factory, as the classes
+    # are not hashable to the type checker
+    fn_abis = [
+        cast(ABIFunction, entry)
+        for entry in _make_contract(dir_path, abi_path).abi
+        if entry.get("type") == "function"
+    ]
+
+    # Overloaded functions are left to web3 to match against the arguments
+    name_counts = Counter(fn_abi["name"] for fn_abi in fn_abis)
+
+    return {
+        fn_abi["name"]: _make_function_info(fn_abi)
+        for fn_abi in fn_abis
+        if name_counts[fn_abi["name"]] == 1
+    }
+
+
 class BaseContractEncoder:
     """
     Base encoder class to represent a smart contract,
@@ -16,13 +75,14 @@ class BaseContractEncoder:
     """
 
     _contract: Type[Contract]
+    _function_infos: dict[str, FunctionInfo]
 
     def __init__(self, dir_path: str, abi_path: str = ""):
-        # Load the ABI from the file's directory
-        abi = load_abi(dir_path, abi_path)
+        # The contract factory is stateless so it is shared across instances
+        self._contract = _make_contract(dir_path, abi_path)
 
-        # Load the address-less contract object
-        self._contract = web3.Web3().eth.contract(abi=abi)
+        # Precomputed function abis, selectors and encoders by name
+        self._function_infos = _get_function_infos(dir_path, abi_path)
 
     def encode_abi(
         self, fn_name: str, *args: tuple[Any], **kwargs: dict[str, Any]
@@ -36,5 +96,24 @@ class BaseContractEncoder:
         Returns:
             The the hexadecimal string representation of the encoded calldata.
         """
-        result: str = self._contract.encodeABI(fn_name, args=args, kwargs=kwargs)
-        return result
+        function_info: Optional[FunctionInfo]
+        function_info = self._function_infos.get(fn_name)
+
+        # Fall back to web3's lookup for overloaded (or unknown) functions
+        if function_info is None:
+            fallback_result: str = self._contract.encodeABI(
+                fn_name, args=args, kwargs=kwargs
+            )
+            return fallback_result
+
+        fn_abi, selector, encoder = function_info
+        fn_arguments = merge_args_and_kwargs(fn_abi, args, kwargs)
+
+        # Encode directly with the function's own encoder, only going through
+        # web3's validation and normalization (e.g., hex strings to bytes) if needed
+        try:
+            calldata: str = selector + encoder(fn_arguments).hex()
+            return calldata
+        except EncodingError:
+            result: str = encode_abi(_W3, fn_abi, fn_arguments, selector)
+            return result
@@ -1 +1 @@
-from .encoder import Erc20Encoder
+from .encoder import Erc20Encoder, get_erc20_encoder
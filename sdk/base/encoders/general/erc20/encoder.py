@@ -1,6 +1,12 @@
+# Standard libraries
+import functools
+
 # Code
 from sdk.base.encoders.contract import BaseContractEncoder
 
+# Constants
+MAX_UINT256 = 2**256 - 1
+
 
 class Erc20Encoder(BaseContractEncoder):
     """
@@ -9,3 +15,40 @@ class Erc20Encoder(BaseContractEncoder):
 
     def __init__(self) -> None:
         super().__init__(dir_path=__file__)
+
+        # Encoded selector and spender words of `increaseAllowance` by spender
+        self.__increase_allowance_prefixes: dict[str, str] = {}
+
+    def encode_increase_allowance(self, spender: str, amount: int) -> str:
+        """
+        Encodes an `increaseAllowance` call, only packing the amount
+        after the first call for the same spender.
+
+        Args:
+            spender: The address of the spender to increase the allowance of.
+            amount: The amount to increase the allowance by.
+        Returns:
+            The hexadecimal string representation of the encoded calldata.
+        """
+        # Leave anything but a plain uint256 to the full encoding and its errors
+        if type(amount) is not int or not 0 <= amount <= MAX_UINT256:
+            return self.encode_abi("increaseAllowance", spender, amount)
+
+        prefix = self.__increase_allowance_prefixes.get(spender)
+        if prefix is None:
+            # The amount is the last 32-byte word (64 hexadecimal characters)
+            prefix = self.encode_abi("increaseAllowance", spender, 0)[:-64]
+            self.__increase_allowance_prefixes[spender] = prefix
+
+        return prefix + format(amount, "064x")
+
+
+@functools.lru_cache(maxsize=None)
+def get_erc20_encoder() -> Erc20Encoder:
+    """
+    Gets the process-wide ERC-20 encoder, as it is the same for every token.
+
+    Returns:
+        The shared ERC-20 encoder.
+    """
+    return Erc20Encoder()
@@ -1,5 +1,5 @@
 # Standard libraries
-from typing import Callable, Any
+from typing import Callable, Any, Mapping
 
 # Code
 from ..configs import BaseConfig, BaseTokenConfig
@@ -17,6 +17,15 @@ class BaseProtocolEncoder:
     def __init__(self, config: BaseConfig):
         self.config = config
 
+        # The config already maps ETH to the WETH token config
+        self._tokens: Mapping[str, BaseTokenConfig] = config.tokens
+        self._eth_symbols = frozenset((config.ETH, config.WETH))
+
+        # Token addresses by symbol, resolved once for the encoding hot paths
+        self._token_addresses: dict[str, str] = {
+            symbol: token.address for symbol, token in config.tokens.items()
+        }
+
     def _get_contract_encoder_partial(
         self, dir_path: str
     ) -> Callable[[Any], BaseContractEncoder]:
@@ -30,19 +39,16 @@ class BaseProtocolEncoder:
         return BaseContractEncoder(dir_path=dir_path, abi_path=abi_path)
 
     def _is_eth(self, symbol: str) -> bool:
-        result: bool = symbol == self.config.ETH or symbol == self.config.WETH
-        return result
+        return symbol in self._eth_symbols
 
     def _get_token(self, symbol: str) -> BaseTokenConfig:
-        # Guard against calls for ETH directly
-        if symbol == self.config.ETH:
-            return self.config.tokens[self.config.WETH]
-
         try:
-            return self.config.tokens[symbol]
+            return self._tokens[symbol]
         except KeyError:
             raise ValueError(f"{symbol} is not a known token.")
 
     def _get_token_address(self, symbol: str) -> str:
-        result: str = self._get_token(symbol).address
-        return result
+        try:
+            return self._token_addresses[symbol]
+        except KeyError:
+            raise ValueError(f"{symbol} is not a known token.")
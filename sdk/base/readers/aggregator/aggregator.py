@@ -1,5 +1,6 @@
 # Standard libraries
-from typing import Generic, Coroutine, Any, TypeVar
+from typing import Generic, Coroutine, Any, TypeVar, Optional, AsyncIterator
+from contextlib import asynccontextmanager, suppress
 import asyncio
 
 # 3rd party libraries
@@ -9,7 +10,7 @@ from aiohttp import ClientSession
 from sdk.lib.numbers import Number, LongShortNumbers
 from sdk.base.configs import BaseConfig
 from sdk.base.readers.constants import POSITION_DECIMALS
-from sdk.base.readers.prices.lazy_resolver import LazyPriceResolver
+from sdk.base.readers.prices.lazy_resolver import LazyPriceResolver, PriceCache
 from sdk.base.readers.structs import (
     PositionsDict,
     PricedPositionsDict,
@@ -24,6 +25,16 @@ from sdk.base.readers.structs import (
 from sdk.base.readers.holdings import HoldingsReader
 from sdk.base.readers.prices import IPriceReader
 from sdk.base.readers.protocols import IProtocolReportReader
+from sdk.base.readers.utils.session import make_rpc_session
+
+# Use uvloop for the sync methods' loop when it is installed (optional)
+try:
+    from uvloop import new_event_loop
+except ImportError:
+    from asyncio import new_event_loop  # type: ignore
+
+# Types
+TAggregator = TypeVar("TAggregator", bound="BaseAggregator[Any, Any]")
 
 
 class BaseAggregator(Generic[TDetails, TPricedDetails]):
@@ -31,6 +42,11 @@ class BaseAggregator(Generic[TDetails, TPricedDetails]):
     Aggregates the readers on one chain to offer a common interface.
 
     NOTE: No docstrings here for conciseness with aggregator pattern.
+
+    NOTE: The aggregator owns a session (when none is injected) and a loop
+          for the sync methods, which are only released on closing it.
+          Call `close()` (or `await aclose()` if only used async) when done,
+          or use it as a context manager (`with` or `async with`).
     """
 
     def __init__(
@@ -40,6 +56,7 @@ class BaseAggregator(Generic[TDetails, TPricedDetails]):
             str, IProtocolReportReader[TDetails, TPricedDetails]
         ],
         price_readers: dict[str, IPriceReader],
+        price_ttl_ms: int = 0,
     ):
         self.config = config
 
@@ -53,13 +70,66 @@ class BaseAggregator(Generic[TDetails, TPricedDetails]):
             # Key error if config has pricing id that doesn't exist
             self.price_readers[symbol] = price_readers[token.pricing.id]
 
+        # Prices shared across calls for up to the ttl (disabled if 0)
+        self.price_ttl_ms = price_ttl_ms
+        self.__price_cache: PriceCache = {}
+
+        # Lazily created on first use since it must be bound to a running loop
+        self.__session: Optional[ClientSession] = None
+        self.__session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # Loop reused by the sync methods, created on first use
+        self.__loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def aclose(self) -> None:
+        """
+        Closes the aggregator's own session (injected sessions are left open).
+        """
+        if self.__session is not None and not self.__session.closed:
+            await self.__session.close()
+
+        self.__session = None
+        self.__session_loop = None
+
+    def close(self) -> None:
+        """
+        Closes the aggregator's own session and the loop used by the sync methods.
+        """
+        loop = self.__loop
+        if loop is None or loop.is_closed():
+            return
+
+        loop.run_until_complete(self.aclose())
+        loop.close()
+        self.__loop = None
+
+    def __enter__(self: TAggregator) -> TAggregator:
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+    async def __aenter__(self: TAggregator) -> TAggregator:
+        return self
+
+    async def __aexit__(self, *_: Any) -> None:
+        await self.aclose()
+
     async def convert_units_async(
-        self, amount: Number, from_symbol: str, to_symbol: str
+        self,
+        amount: Number,
+        from_symbol: str,
+        to_symbol: str,
+        session: Optional[ClientSession] = None,
     ) -> Number:
-        async with ClientSession() as session:
-            # So we just set the position to 0
-            price_resolver = LazyPriceResolver(self.price_readers)
-            price_resolver.update_positions(PositionsDict())
+        # Nothing to read when converting to the same units
+        if from_symbol == to_symbol:
+            same_amount: Number = amount.copy()
+            return same_amount
+
+        async with self.__session_scope(session) as session:
+            # Raw prices do not depend on our positions
+            price_resolver = self.__make_price_resolver(num_coroutines=0)
 
             # Get the exchange ratio
             from_price: Number
@@ -73,12 +143,12 @@ class BaseAggregator(Generic[TDetails, TPricedDetails]):
 
             return amount * from_price // to_price
 
-    async def get_price_async(self, symbol: str) -> Number:
-        async with ClientSession() as session:
+    async def get_price_async(
+        self, symbol: str, session: Optional[ClientSession] = None
+    ) -> Number:
+        async with self.__session_scope(session) as session:
             # Getting the raw price does not depend on our current positions
-            # So we just set the position to 0
-            price_resolver = LazyPriceResolver(self.price_readers)
-            price_resolver.update_positions(PositionsDict({symbol: LongShortNumbers()}))
+            price_resolver = self.__make_price_resolver(num_coroutines=0)
             result: Number = await price_resolver.resolve_price(symbol, session)
             return result
 
@@ -103,16 +173,20 @@ class BaseAggregator(Generic[TDetails, TPricedDetails]):
     # -----------------
     # Holdings report
     # -----------------
-    async def get_holdings_report_async(self) -> PositionsDict:
-        async with ClientSession() as session:
+    async def get_holdings_report_async(
+        self, session: Optional[ClientSession] = None
+    ) -> PositionsDict:
+        async with self.__session_scope(session) as session:
             result: PositionsDict = await self.holdings_reader.get_positions(session)
             return result
 
-    async def get_holdings_priced_report_async(self) -> PricedPositionsDict:
-        async with ClientSession() as session:
+    async def get_holdings_priced_report_async(
+        self, session: Optional[ClientSession] = None
+    ) -> PricedPositionsDict:
+        async with self.__session_scope(session) as session:
             result: PricedPositionsDict
             result = await self.holdings_reader.get_priced_positions(
-                LazyPriceResolver(self.price_readers), session
+                self.__make_price_resolver(), session
             )
             return result
 
@@ -133,19 +207,21 @@ class BaseAggregator(Generic[TDetails, TPricedDetails]):
     # -----------------
     # Protocol report
     # -----------------
-    async def get_protocol_report_async(self, name: str) -> ProtocolReport[TDetails]:
-        async with ClientSession() as session:
+    async def get_protocol_report_async(
+        self, name: str, session: Optional[ClientSession] = None
+    ) -> ProtocolReport[TDetails]:
+        async with self.__session_scope(session) as session:
             result: ProtocolReport[TDetails]
             result = await self.protocol_report_readers[name].get_report(session)
             return result
 
     async def get_protocol_priced_report_async(
-        self, name: str
+        self, name: str, session: Optional[ClientSession] = None
     ) -> ProtocolPricedReport[TPricedDetails]:
-        async with ClientSession() as session:
+        async with self.__session_scope(session) as session:
             result: ProtocolPricedReport[TPricedDetails]
             result = await self.protocol_report_readers[name].get_priced_report(
-                LazyPriceResolver(self.price_readers), session
+                self.__make_price_resolver(), session
             )
             return result
 
@@ -169,8 +245,10 @@ class BaseAggregator(Generic[TDetails, TPricedDetails]):
     # -------------
     # Full report
     # -------------
-    async def get_chain_report_async(self) -> ChainReport[TDetails]:
-        async with ClientSession() as session:
+    async def get_chain_report_async(
+        self, session: Optional[ClientSession] = None
+    ) -> ChainReport[TDetails]:
+        async with self.__session_scope(session) as session:
             holdings = await self.holdings_reader.get_positions(session)
 
             protocol_names = self.protocol_report_readers.keys()
@@ -182,11 +260,13 @@ class BaseAggregator(Generic[TDetails, TPricedDetails]):
                 ]
             )
 
-            total = PositionsDict() + holdings
-            protocols: dict[str, ProtocolReport[TDetails]] = {}
-            for name, report in zip(protocol_names, protocol_reports):
-                protocols[name] = report
-                total += report.positions
+            # Sum everything into a single dict
+            protocols: dict[str, ProtocolReport[TDetails]] = dict(
+                zip(protocol_names, protocol_reports)
+            )
+            total = PositionsDict.sum(
+                [holdings, *(report.positions for report in protocol_reports)]
+            )
 
             return ChainReport[TDetails](
                 total=total,
@@ -194,12 +274,14 @@ class BaseAggregator(Generic[TDetails, TPricedDetails]):
                 protocols=protocols,
             )
 
-    async def get_chain_priced_report_async(self) -> ChainPricedReport[TPricedDetails]:
-        price_resolver = LazyPriceResolver(
-            self.price_readers, num_coroutines=len(self.protocol_report_readers) + 1
+    async def get_chain_priced_report_async(
+        self, session: Optional[ClientSession] = None
+    ) -> ChainPricedReport[TPricedDetails]:
+        price_resolver = self.__make_price_resolver(
+            num_coroutines=len(self.protocol_report_readers) + 1
         )
 
-        async with ClientSession() as session:
+        async with self.__session_scope(session) as session:
             holdings: PricedPositionsDict
             protocol_reports: list[ProtocolPricedReport[TPricedDetails]]
             protocol_names = self.protocol_report_readers.keys()
@@ -215,19 +297,29 @@ class BaseAggregator(Generic[TDetails, TPricedDetails]):
             )
 
             # Aggregate holdings
-            holdings_value = LongShortNumbers()
-            for position in holdings.values():
-                holdings_value += position.value
+            holdings_value = LongShortNumbers.sum(
+                position.value for position in holdings.values()
+            )
 
             # Aggregate protocols into total (and convert reports to dict)
             protocols_dict: dict[str, ProtocolPricedReport[TPricedDetails]] = {}
-            total = PricedPositionsDict() + holdings
-            total_value = holdings_value.deepcopy()
+            total = PricedPositionsDict()
+            total += holdings
             for name, report in zip(protocol_names, protocol_reports):
                 protocols_dict[name] = report
                 total += report.positions
-                for position in report.positions.values():
-                    total_value += position.value
+
+            # Sum all the values in one pass per column
+            total_value = LongShortNumbers.sum(
+                [
+                    holdings_value,
+                    *(
+                        position.value
+                        for report in protocol_reports
+                        for position in report.positions.values()
+                    ),
+                ]
+            )
 
             return ChainPricedReport[TPricedDetails](
                 total=PricedReport(value=total_value, positions=total),
@@ -251,11 +343,44 @@ class BaseAggregator(Generic[TDetails, TPricedDetails]):
         )
         return result
 
+    def __make_price_resolver(self, num_coroutines: int = 1) -> LazyPriceResolver:
+        return LazyPriceResolver(
+            self.price_readers,
+            num_coroutines=num_coroutines,
+            price_cache=self.__price_cache,
+            price_ttl_ms=self.price_ttl_ms,
+        )
+
+    @asynccontextmanager
+    async def __session_scope(
+        self, session: Optional[ClientSession]
+    ) -> AsyncIterator[ClientSession]:
+        # Prefer the caller's session, otherwise reuse our own across calls
+        yield session if session is not None else await self.__get_session()
+
+    async def __get_session(self) -> ClientSession:
+        loop = asyncio.get_running_loop()
+
+        # Sessions cannot be shared across loops, so rebuild if the loop changed
+        if (
+            self.__session is None
+            or self.__session.closed
+            or self.__session_loop is not loop
+        ):
+            if self.__session is not None and not self.__session.closed:
+                # Release the stale pool (its transports' loop may be closed already)
+                with suppress(RuntimeError):
+                    await self.__session.close()
+
+            self.__session = make_rpc_session()
+            self.__session_loop = loop
+
+        return self.__session
+
     TReturn = TypeVar("TReturn")
 
-    @staticmethod
     def __async_to_sync(
-        coroutine: Coroutine[Any, Any, TReturn], is_background: bool
+        self, coroutine: Coroutine[Any, Any, TReturn], is_background: bool
     ) -> TReturn:
         # When using as background task
         if is_background:
@@ -263,5 +388,10 @@ class BaseAggregator(Generic[TDetails, TPricedDetails]):
                 coroutine, asyncio.get_event_loop()
             ).result()
 
-        loop = asyncio.get_event_loop()
+        # Reuse one loop across sync calls (and with it the pooled session)
+        loop = self.__loop
+        if loop is None or loop.is_closed():
+            new_loop: asyncio.AbstractEventLoop = new_event_loop()
+            loop = self.__loop = new_loop
+
         return loop.run_until_complete(coroutine)
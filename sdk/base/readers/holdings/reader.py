@@ -1,5 +1,4 @@
 # Standard libraries
-from typing import Optional
 import asyncio
 
 # 3rd party libraries
@@ -11,10 +10,15 @@ from sdk.base.configs import BaseConfig
 from sdk.base.readers.constants import POSITION_DECIMALS
 from sdk.base.readers.structs import PositionsDict, PricedPosition, PricedPositionsDict
 from sdk.base.readers.utils.calls import (
-    call_eth_method,
-    make_eth_call,
     encode_calldata,
     decode_result,
+    hex_to_bytes,
+    bytes_to_hex,
+)
+from sdk.base.readers.utils.batch import RpcBatch
+from sdk.base.readers.utils.multicall import (
+    encode_multicall_inputs,
+    decode_multicall_result,
 )
 from sdk.base.readers.utils.selectors import selector_from_sig
 from sdk.base.readers.prices import IPriceResolver
@@ -37,6 +41,13 @@ class HoldingsReader(IHoldingsReader):
     def __init__(self, config: BaseConfig):
         self.config = config
 
+        # The fund address argument is the same for every token and every read
+        self.__balance_of_calldata = encode_calldata(
+            ERC20_BALANCE_OF_SELECTOR,
+            ERC20_BALANCE_OF_INPUT_TYPES,
+            [config.fund_address],
+        )
+
     # -----------
     # Positions
     # -----------
@@ -51,32 +62,23 @@ class HoldingsReader(IHoldingsReader):
         """
         positions_dict = PositionsDict()
 
-        # Start fetching token positions
-        symbols = self.config.tokens.keys()
-        token_tasks = asyncio.gather(
-            *[self.__fetch_token_snapshot(symbol, session) for symbol in symbols]
-        )
-
-        # Start fetching eth position
-        eth_task = asyncio.create_task(self.__fetch_eth_snapshot(session))
+        # Queue the token balances multicall and the eth balance into one request
+        batch = RpcBatch(session, self.config.read_uri)
+        symbols = list(self.config.tokens.keys())
+        tokens_future = self.__enqueue_tokens_snapshot(batch, symbols)
+        eth_future = self.__enqueue_eth_snapshot(batch)
+        await batch.flush()
 
         # Record the positions
-        token_results = await token_tasks
-        for positions in token_results:
-            positions_dict += positions
-
-        positions_dict += await eth_task
+        positions_dict += self.__parse_tokens_snapshot(symbols, tokens_future.result())
+        positions_dict += self.__parse_eth_snapshot(eth_future.result())
 
         return positions_dict
 
-    async def __fetch_eth_snapshot(self, session: ClientSession) -> PositionsDict:
-        result = await call_eth_method(
-            session,
-            self.config.rpc_uri,
-            "eth_getBalance",
-            [self.config.fund_address, "latest"],
-        )
+    def __enqueue_eth_snapshot(self, batch: RpcBatch) -> "asyncio.Future[str]":
+        return batch.enqueue("eth_getBalance", [self.config.fund_address, "latest"])
 
+    def __parse_eth_snapshot(self, result: str) -> PositionsDict:
         eth_value = Number(value=int(result, 16), decimals=18)
         eth_value.set_decimals(POSITION_DECIMALS)
 
@@ -84,36 +86,47 @@ class HoldingsReader(IHoldingsReader):
             {self.config.ETH: LongShortNumbers(net=eth_value, long=eth_value)}
         )
 
-    async def __fetch_token_snapshot(
-        self, symbol: str, session: ClientSession
-    ) -> PositionsDict:
-        token = self.config.tokens[symbol]
-
-        # Encode the arguments and form the calldata
-        calldata = encode_calldata(
-            ERC20_BALANCE_OF_SELECTOR,
-            ERC20_BALANCE_OF_INPUT_TYPES,
-            [self.config.fund_address],
+    def __enqueue_tokens_snapshot(
+        self, batch: RpcBatch, symbols: list[str]
+    ) -> "asyncio.Future[str]":
+        multicall_calldata = encode_multicall_inputs(
+            [
+                (self.config.tokens[symbol].address, self.__balance_of_calldata)
+                for symbol in symbols
+            ]
         )
 
-        # Await the result
-        result = await make_eth_call(
-            session, self.config.rpc_uri, token.address, calldata
+        return batch.enqueue(
+            "eth_call",
+            [
+                {
+                    "to": self.config.multicall_address,
+                    "data": bytes_to_hex(multicall_calldata),
+                },
+                "latest",
+            ],
         )
 
-        # Decode the result
-        balance_int: int
-        (balance_int,) = decode_result(ERC20_BALANCE_OF_OUTPUT_TYPES, result)
+    def __parse_tokens_snapshot(self, symbols: list[str], result: str) -> PositionsDict:
+        positions_dict = PositionsDict()
 
-        # Return an empty position if balance is 0
-        if balance_int == 0:
-            return PositionsDict()
+        _, outputs = decode_multicall_result(hex_to_bytes(result))
+        for symbol, output in zip(symbols, outputs):
+            token = self.config.tokens[symbol]
 
-        # Parse the result into the `Value` struct
-        balance = Number(value=balance_int, decimals=token.decimals)
+            # Decode the result
+            balance_int: int
+            (balance_int,) = decode_result(ERC20_BALANCE_OF_OUTPUT_TYPES, output)
 
-        # Structuring and returning
-        return PositionsDict({symbol: LongShortNumbers(net=balance, long=balance)})
+            # Skip empty positions
+            if balance_int == 0:
+                continue
+
+            # Parse the result into the `Value` struct
+            balance = Number(value=balance_int, decimals=token.decimals)
+            positions_dict[symbol] = LongShortNumbers(net=balance, long=balance)
+
+        return positions_dict
 
     # ------------------
     # Priced positions
@@ -134,13 +147,13 @@ class HoldingsReader(IHoldingsReader):
         positions = await self.get_positions(session)
 
         price_resolver.update_positions(positions)
-        prices = await price_resolver.resolve_prices(positions.keys(), session)
-
-        priced_positions_dict = PricedPositionsDict()
-        for symbol in positions.keys():
-            priced_positions_dict[symbol] = PricedPosition(
-                amount=positions[symbol],
-                value=positions[symbol].broadcast_mul(prices[symbol]),
-            )
-
-        return priced_positions_dict
+        prices = await price_resolver.resolve_prices(tuple(positions), session)
+
+        return PricedPositionsDict(
+            {
+                symbol: PricedPosition.construct(
+                    amount=amount, value=amount.broadcast_mul(prices[symbol])
+                )
+                for symbol, amount in positions.items()
+            }
+        )
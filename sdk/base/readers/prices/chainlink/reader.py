@@ -1,3 +1,8 @@
+# Standard libraries
+from typing import Optional
+import asyncio
+import time
+
 # 3rd party libraries
 from aiohttp import ClientSession
 
@@ -6,8 +11,9 @@ from sdk.lib.numbers import LongShortNumbers, Number
 from sdk.base.configs import BaseConfig, GenericTokenConfig
 from sdk.base.configs.prices import ChainlinkPricingConfig
 from sdk.base.readers.constants import PRICE_DECIMALS
-from sdk.base.readers.utils.calls import make_eth_call, decode_result
+from sdk.base.readers.utils.calls import decode_result
 from sdk.base.readers.utils.multicall import (
+    make_multicall_eth_call,
     encode_multicall_inputs,
     decode_multicall_result,
 )
@@ -47,6 +53,15 @@ class ChainlinkPriceReader(IPriceReader):
             if token.pricing.id == self.id:
                 self.tokens[symbol] = token
 
+        # Oracle decimals never change so they are only read once
+        self.decimals: dict[str, int] = {
+            symbol: token.pricing.decimals
+            for symbol, token in self.tokens.items()
+            if token.pricing.decimals is not None
+        }
+        # The fetch of the missing decimals in flight, shared by concurrent callers
+        self.__decimals_task: Optional["asyncio.Task[None]"] = None
+
     async def get_price(
         self,
         symbol: str,
@@ -65,25 +80,78 @@ class ChainlinkPriceReader(IPriceReader):
         Returns:
             The price for the symbol.
         """
-        oracle_address = self.tokens[symbol].pricing.address
+        if symbol not in self.decimals:
+            task = self.__decimals_task
+            if task is None or task.get_loop() is not asyncio.get_running_loop():
+                task = self.__decimals_task = asyncio.create_task(
+                    self.__fetch_decimals(session)
+                )
+
+            # Shielded so that a cancelled caller does not cancel it for the others
+            await asyncio.shield(task)
+
+        result = await make_multicall_eth_call(
+            session,
+            self.config.read_uri,
+            self.config.multicall_address,
+            self.tokens[symbol].pricing.address,
+            CHAINLINK_LATEST_ROUND_SELECTOR,
+        )
+
+        round_id: int
+        answer: int
+        updated_at: int
+        answered_in_round: int
+        round_id, answer, _, updated_at, answered_in_round = decode_result(
+            CHAINLINK_LATEST_ROUND_OUTPUT_TYPES, result
+        )
+
+        # Guard against answers carried over from an incomplete round
+        if answered_in_round < round_id:
+            raise ValueError(
+                f"Chainlink answer for {symbol} is from round {answered_in_round}, "
+                f"before the latest round {round_id}."
+            )
+
+        # Guard against answers not updated within the oracle's heartbeat
+        heartbeat = self.tokens[symbol].pricing.heartbeat
+        if heartbeat is not None and time.time() - updated_at > heartbeat:
+            raise ValueError(
+                f"Chainlink answer for {symbol} was last updated at {updated_at}, "
+                f"over its {heartbeat}s heartbeat ago."
+            )
+
+        return Number(value=answer, decimals=self.decimals[symbol]).set_decimals(
+            PRICE_DECIMALS
+        )
+
+    async def __fetch_decimals(self, session: ClientSession) -> None:
+        # Read all the missing decimals together in one multicall
+        symbols = [symbol for symbol in self.tokens if symbol not in self.decimals]
 
         multicall_calldata = encode_multicall_inputs(
             [
-                (oracle_address, CHAINLINK_DECIMALS_SELECTOR),
-                (oracle_address, CHAINLINK_LATEST_ROUND_SELECTOR),
+                (self.tokens[symbol].pricing.address, CHAINLINK_DECIMALS_SELECTOR)
+                for symbol in symbols
             ]
         )
 
-        result = await make_eth_call(
-            session,
-            self.config.rpc_uri,
-            self.config.multicall_address,
-            multicall_calldata,
-        )
+        try:
+            result = await make_multicall_eth_call(
+                session,
+                self.config.read_uri,
+                self.config.multicall_address,
+                self.config.multicall_address,
+                multicall_calldata,
+            )
+        finally:
+            # Done either way, so a failed fetch is retried by the next caller
+            if self.__decimals_task is asyncio.current_task():
+                self.__decimals_task = None
 
         _, outputs = decode_multicall_result(result)
 
-        (decimals,) = decode_result(CHAINLINK_DECIMALS_OUTPUT_TYPES, outputs[0])
-        _, answer, *_ = decode_result(CHAINLINK_LATEST_ROUND_OUTPUT_TYPES, outputs[1])
-
-        return Number(value=answer, decimals=decimals).set_decimals(PRICE_DECIMALS)
+        for symbol, output in zip(symbols, outputs):
+            (self.decimals[symbol],) = decode_result(
+                CHAINLINK_DECIMALS_OUTPUT_TYPES, output
+            )
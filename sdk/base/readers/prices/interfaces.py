@@ -1,6 +1,6 @@
 # Standard libraries
 from abc import ABC, abstractmethod
-from typing import Protocol, Iterable, Callable, Coroutine, Any
+from typing import Protocol, Sequence, Callable, Coroutine, Any
 
 # Third party libraries
 from aiohttp import ClientSession
@@ -25,7 +25,7 @@ class IPriceResolver(Protocol):
         ...
 
     async def resolve_prices(
-        self, symbols: Iterable[str], session: ClientSession
+        self, symbols: Sequence[str], session: ClientSession
     ) -> dict[str, Number]:
         ...
 
@@ -36,6 +36,8 @@ class IPriceReader(ABC):
     """
 
     id: str
+    # Whether the price depends on the position held (e.g., liquidation prices)
+    position_dependent: bool = False
 
     @abstractmethod
     async def get_price(
@@ -1,6 +1,7 @@
 # Standard libraries
-from typing import Iterable
+from typing import Iterable, Optional, Sequence
 import asyncio
+import time
 
 # 3rd party libraries
 from aiohttp import ClientSession
@@ -10,6 +11,11 @@ from sdk.lib.numbers import Number
 from sdk.base.readers.structs import PositionsDict
 from .interfaces import IPriceReader
 
+# Cached prices by symbol and the net position they were priced at
+# (only for position dependent readers), along with the time they were read at
+PriceCacheKey = tuple[str, Optional[tuple[int, int]]]
+PriceCache = dict[PriceCacheKey, tuple[Number, float]]
+
 
 class LazyPriceResolver:
     """
@@ -24,6 +30,10 @@ class LazyPriceResolver:
           e.g., Pricing CAKE with Pancakeswap quoting on USDT
           but pricing USDT also with Pancakeswap quoting on CAKE.
           We have put in place a 10-second timeout before throwing an exception.
+
+    NOTE: Prices can be shared across resolvers through a price cache,
+          reusing those read within the last `price_ttl_ms` milliseconds
+          (for the same net position if their reader depends on it).
     """
 
     price_readers: dict[str, IPriceReader]
@@ -33,16 +43,30 @@ class LazyPriceResolver:
     positions: PositionsDict
     tasks: dict[str, asyncio.Task[Number]]
     results: dict[str, Number]
+    price_cache: Optional[PriceCache]
+    price_ttl: float
 
-    def __init__(self, price_readers: dict[str, IPriceReader], num_coroutines: int = 1):
+    def __init__(
+        self,
+        price_readers: dict[str, IPriceReader],
+        num_coroutines: int = 1,
+        price_cache: Optional[PriceCache] = None,
+        price_ttl_ms: int = 0,
+    ):
         self.price_readers = price_readers
         self.num_coroutines = num_coroutines
+        self.price_cache = price_cache if price_ttl_ms > 0 else None
+        self.price_ttl = price_ttl_ms / 1000
         self.counter = 0
         self.is_ready_to_fetch_prices = asyncio.Event()
         self.positions = PositionsDict()
         self.tasks = {}
         self.results = {}
 
+        # Without any coroutines to wait on, prices are read at zero positions
+        if num_coroutines == 0:
+            self.is_ready_to_fetch_prices.set()
+
     def update_positions(self, positions: PositionsDict) -> None:
         """
         Tracks the positions to facilitate downstream pricing
@@ -53,6 +77,20 @@ class LazyPriceResolver:
         if self.counter == self.num_coroutines:
             self.is_ready_to_fetch_prices.set()
 
+    async def prefetch(
+        self,
+        symbols: Iterable[str],
+        session: ClientSession,
+    ) -> None:
+        """
+        Starts resolving the prices of the symbols without waiting for them,
+        once all coroutines have updated their positions.
+        """
+        await self.is_ready_to_fetch_prices.wait()
+
+        for symbol in symbols:
+            self.__start_task(symbol, session)
+
     async def resolve_price(
         self,
         symbol: str,
@@ -62,33 +100,89 @@ class LazyPriceResolver:
         Allows multiple coroutines to resolve a price on-demand
         e.g., in different protocols.
         """
+        # Plain lookup if already resolved
+        if symbol in self.results:
+            return self.results[symbol]
+
         # Wait for all coroutines to update positions before starting
         await self.is_ready_to_fetch_prices.wait()
 
-        # Start the task if not already started
-        if symbol not in self.tasks.keys():
-            self.tasks[symbol] = asyncio.create_task(
-                self.price_readers[symbol].get_price(
-                    symbol, self.positions.get(symbol), self, session
-                )
-            )
+        # Start the task if not already started (or take a cached price)
+        task = self.__start_task(symbol, session)
+        if task is None:
+            return self.results[symbol]
 
         # Wait for the response (instant if already previously awaited)
         # We use asyncio to raise TimeoutError if more than 10 seconds
         # Guards against circular dependencies in pricing.
-        self.results[symbol] = await asyncio.wait_for(self.tasks[symbol], 10)
-        return self.results[symbol]
+        price = await asyncio.wait_for(task, 10)
+        self.results[symbol] = price
+        return price
 
     async def resolve_prices(
         self,
-        symbols: Iterable[str],
+        symbols: Sequence[str],
         session: ClientSession,
     ) -> dict[str, Number]:
         """
         Allows multiple coroutines to resolve a price on-demand
         e.g., in different protocols.
         """
+        # Start all the requested symbols at once (their readers start their own
+        # quote dependencies), leaving the other tracked positions unread
+        await self.prefetch(symbols, session)
+
         prices = await asyncio.gather(
             *[self.resolve_price(symbol, session) for symbol in symbols]
         )
         return {symbol: price for symbol, price in zip(symbols, prices)}
+
+    def __start_task(
+        self, symbol: str, session: ClientSession
+    ) -> Optional["asyncio.Task[Number]"]:
+        """
+        Gets the symbol's price task, starting it if needed.
+        Returns None if the price is already in the results instead.
+        """
+        task = self.tasks.get(symbol)
+        if task is not None or symbol in self.results:
+            return task
+
+        # Reuse a recently read price for the same position if caching
+        if self.price_cache is not None:
+            cached = self.price_cache.get(self.__get_cache_key(symbol))
+            if cached is not None and time.monotonic() - cached[1] < self.price_ttl:
+                self.results[symbol] = cached[0].copy()
+                return None
+
+        task = asyncio.create_task(self.__read_price(symbol, session))
+        self.tasks[symbol] = task
+        return task
+
+    async def __read_price(self, symbol: str, session: ClientSession) -> Number:
+        price = await self.price_readers[symbol].get_price(
+            symbol, self.positions.get(symbol), self, session
+        )
+
+        if self.price_cache is not None:
+            now = time.monotonic()
+
+            # Evict the expired prices, since positions keep changing some keys
+            expired_keys = [
+                key
+                for key, (_, read_at) in self.price_cache.items()
+                if now - read_at >= self.price_ttl
+            ]
+            for key in expired_keys:
+                del self.price_cache[key]
+
+            self.price_cache[self.__get_cache_key(symbol)] = (price.copy(), now)
+
+        return price
+
+    def __get_cache_key(self, symbol: str) -> PriceCacheKey:
+        if not self.price_readers[symbol].position_dependent:
+            return symbol, None
+
+        net = self.positions.get(symbol).net
+        return symbol, (net.value, net.decimals)
@@ -1,6 +1,6 @@
 # Standard libraries
 from __future__ import annotations
-from typing import TypeVar, Generic, Any
+from typing import TypeVar, Generic, Any, Iterable
 from copy import deepcopy
 
 # Code
@@ -14,8 +14,10 @@ class PositionsDict(dict[str, LongShortNumbers]):
     """
 
     def __iadd__(self, other: PositionsDict) -> PositionsDict:
+        # Positions are replaced rather than mutated so new ones can be shared
         for symbol, amount in other.items():
-            self[symbol] = self.get(symbol) + amount
+            current = dict.get(self, symbol)
+            self[symbol] = amount if current is None else current + amount
         return self
 
     def __add__(self, other: PositionsDict) -> PositionsDict:
@@ -23,8 +25,30 @@ class PositionsDict(dict[str, LongShortNumbers]):
         copy += other
         return copy
 
+    @classmethod
+    def sum(cls, items: Iterable[PositionsDict]) -> PositionsDict:
+        """
+        Sums the positions dicts, summing each symbol's positions only once,
+        equivalent to adding each of them onto `PositionsDict()`.
+        """
+        amounts_by_symbol: dict[str, list[LongShortNumbers]] = {}
+        for positions in items:
+            for symbol, amount in positions.items():
+                amounts_by_symbol.setdefault(symbol, []).append(amount)
+
+        # Lone positions are kept as is, as adding them onto an empty dict would
+        summed = cls()
+        for symbol, amounts in amounts_by_symbol.items():
+            summed[symbol] = (
+                amounts[0] if len(amounts) == 1 else LongShortNumbers.sum(amounts)
+            )
+
+        return summed
+
     def get(self, key: str) -> LongShortNumbers:  # type: ignore[override]
-        return super().get(key, LongShortNumbers())
+        # Only build the empty default when the symbol is actually missing
+        amount = dict.get(self, key)
+        return amount if amount is not None else LongShortNumbers()
 
     def dict(self) -> dict[str, Any]:
         return {key: value.dict() for key, value in self.items()}
@@ -33,6 +57,9 @@ class PositionsDict(dict[str, LongShortNumbers]):
 class PricedNetPosition(FrozenModel):
     """
     Priced position with the amount and value as the net scalar number.
+
+    NOTE: Built with `construct` by the readers since the amount and value
+          are already numbers, skipping pydantic's validation per position.
     """
 
     amount: Number = Number()
@@ -42,15 +69,19 @@ class PricedNetPosition(FrozenModel):
 class PricedPosition(FrozenModel):
     """
     Priced position with the amount and value as detailed long-short numbers.
+
+    NOTE: Built with `construct` by the readers since the amount and value
+          are already long-short numbers, skipping pydantic's validation.
     """
 
     amount: LongShortNumbers = LongShortNumbers()
     value: LongShortNumbers = LongShortNumbers()
 
     def __add__(self, other: PricedPosition) -> PricedPosition:
-        return PricedPosition(
+        result: PricedPosition = PricedPosition.construct(
             amount=self.amount + other.amount, value=self.value + other.value
         )
+        return result
 
 
 class PricedPositionsDict(dict[str, PricedPosition]):
@@ -63,15 +94,22 @@ class PricedPositionsDict(dict[str, PricedPosition]):
     """
 
     def deepcopy(self) -> PricedPositionsDict:
+        """
+        Fully isolated copy of the positions.
+
+        NOTE: Not needed for aggregating since adding never mutates entries.
+        """
         return deepcopy(self)
 
     def __iadd__(self, other: PricedPositionsDict) -> PricedPositionsDict:
         for symbol, amount in other.items():
-            self[symbol] = self.get(symbol, PricedPosition()) + amount
+            current = self.get(symbol)
+            self[symbol] = amount if current is None else current + amount
         return self
 
     def __add__(self, other: PricedPositionsDict) -> PricedPositionsDict:
-        copy = self.deepcopy()
+        # Adding replaces entries with new positions, so a shallow copy is enough
+        copy = PricedPositionsDict(self)
         copy += other
         return copy
 
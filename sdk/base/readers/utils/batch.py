@@ -0,0 +1,502 @@
+# Standard libraries
+from typing import Any, Optional, Union
+from weakref import ReferenceType, WeakKeyDictionary, ref
+import asyncio
+import functools
+
+# 3rd party libraries
+from aiohttp import ClientSession, ClientTimeout, ClientWebSocketResponse, WSMsgType
+import orjson
+
+# Code
+from sdk.base.connector import WEBSOCKET_PREFIXES
+
+# Types
+TParams = Union[
+    tuple[Union[str, dict[str, str]], ...], list[Union[str, dict[str, str]]]
+]
+TCall = tuple[str, TParams]
+
+# Constants
+BATCH_WINDOW = 0.005  # seconds
+MAX_BATCH_SIZE = 20  # calls per request, as providers cap the batch sizes
+RPC_TIMEOUT = ClientTimeout(total=30)  # seconds per request, not per session
+# Ask for compressed responses explicitly, even on injected sessions
+# that skip aiohttp's default headers (decompressed by aiohttp itself)
+JSON_HEADERS = {"Content-Type": "application/json", "Accept-Encoding": "gzip, deflate"}
+MAX_CONCURRENT_REQUESTS = 32  # in-flight requests per session
+MAX_ATTEMPTS = 3  # per request, retrying only on rate limits and server errors
+RETRY_BACKOFF = 0.5  # seconds before the first retry, doubled after every retry
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+@functools.lru_cache(maxsize=None)
+def _get_request_prefix(method: str) -> bytes:
+    # Everything up to the params is the same for every call of a method
+    return b'{"jsonrpc":"2.0","method":' + orjson.dumps(method) + b',"params":'
+
+
+def encode_request(request_id: int, method: str, params: TParams) -> bytes:
+    """
+    Encodes a json-rpc request body.
+
+    Args:
+        request_id: The id of the request.
+        method: The eth method to call.
+        params: The params for the rpc call.
+
+    Returns:
+        The serialized json-rpc request body.
+    """
+    return (
+        _get_request_prefix(method) + orjson.dumps(params) + b',"id":%d}' % request_id
+    )
+
+
+async def post_calls(
+    session: ClientSession, rpc_uri: str, calls: list[TCall]
+) -> list[dict[str, Any]]:
+    """
+    Posts the rpc calls to the node provider in a single request,
+    as a plain request if there is only one call.
+
+    Args:
+        session: The async client session.
+        rpc_uri: The node provider's rpc endpoint.
+        calls: The list of methods and params to call, given 1-based ids in order.
+
+    Returns:
+        The json-rpc responses in the order of the calls.
+    """
+    # Split larger batches into concurrent requests within the providers' caps
+    if len(calls) > MAX_BATCH_SIZE:
+        chunks = await asyncio.gather(
+            *[
+                post_calls(session, rpc_uri, calls[i : i + MAX_BATCH_SIZE])
+                for i in range(0, len(calls), MAX_BATCH_SIZE)
+            ]
+        )
+        return [item for chunk in chunks for item in chunk]
+
+    # Websocket endpoints are called over a persistent connection instead
+    if rpc_uri.startswith(WEBSOCKET_PREFIXES):
+        return await get_ws_client(session, rpc_uri).post_calls(calls)
+
+    if len(calls) == 1:
+        body = encode_request(1, *calls[0])
+    else:
+        body = b"[%s]" % b",".join(
+            encode_request(request_id, method, params)
+            for request_id, (method, params) in enumerate(calls, 1)
+        )
+
+    json_response = await post_request(session, rpc_uri, body)
+
+    if len(calls) == 1:
+        return [json_response]
+
+    # Providers rejecting the whole batch answer with a single error object,
+    # so fan it out as the error of every call
+    if isinstance(json_response, dict):
+        if "error" not in json_response:
+            raise ValueError(f"Unexpected response to an RPC batch: {json_response}")
+        return [
+            {**json_response, "id": request_id}
+            for request_id in range(1, len(calls) + 1)
+        ]
+
+    # Responses in a batch may come back in any order
+    items_by_id = {item.get("id"): item for item in json_response}
+
+    # Calls left unanswered fail on their own, with the id-less error if any
+    id_less_item = items_by_id.get(None)
+    missing_error = (
+        id_less_item["error"]
+        if id_less_item is not None and "error" in id_less_item
+        else "No response."
+    )
+    return [
+        items_by_id.get(request_id)
+        or {"jsonrpc": "2.0", "id": request_id, "error": missing_error}
+        for request_id in range(1, len(calls) + 1)
+    ]
+
+
+async def post_request(session: ClientSession, rpc_uri: str, body: bytes) -> Any:
+    """
+    Posts a json-rpc request body, bounding the requests in flight per session
+    and backing off on rate limits and server errors.
+
+    Args:
+        session: The async client session.
+        rpc_uri: The node provider's rpc endpoint.
+        body: The serialized json-rpc request body.
+
+    Returns:
+        The deserialized json-rpc response.
+    """
+    attempt = 1
+    backoff = RETRY_BACKOFF
+
+    while True:
+        async with get_semaphore(session):
+            response = await session.post(
+                rpc_uri, data=body, headers=JSON_HEADERS, timeout=RPC_TIMEOUT
+            )
+            if response.status not in RETRY_STATUSES:
+                return orjson.loads(await response.read())
+
+            # Raise on the last attempt, otherwise free the connection to retry
+            if attempt == MAX_ATTEMPTS:
+                response.raise_for_status()
+            response.release()
+
+        # Back off outside of the semaphore to let the other requests through
+        await asyncio.sleep(backoff)
+        attempt += 1
+        backoff *= 2
+
+
+def deref_session(session_ref: "ReferenceType[ClientSession]") -> ClientSession:
+    """
+    Gets a session held through a weak reference.
+
+    NOTE: The shared batchers and clients only hold their sessions weakly,
+          for the registries keyed by the sessions to be able to drop them.
+
+    Args:
+        session_ref: The weak reference to the session.
+
+    Returns:
+        The async client session.
+    """
+    session = session_ref()
+    if session is None:
+        raise RuntimeError("The client session has already been garbage collected.")
+
+    return session
+
+
+def get_result(item: dict[str, Any]) -> str:
+    """
+    Gets the result of a json-rpc response.
+
+    Args:
+        item: The json-rpc response.
+
+    Returns:
+        The raw hexadecimal result string.
+    """
+    if "error" in item:
+        raise ValueError(f"RPC call {item.get('id')} failed: {item['error']}")
+
+    result: str = item["result"]
+    return result
+
+
+async def batch_call(
+    session: ClientSession, rpc_uri: str, calls: list[TCall]
+) -> list[str]:
+    """
+    Performs a batch of rpc calls to the node provider in a single request.
+
+    Args:
+        session: The async client session.
+        rpc_uri: The node provider's rpc endpoint.
+        calls: The list of methods and params to call.
+
+    Returns:
+        The raw hexadecimal result strings in the order of the calls.
+    """
+    return [get_result(item) for item in await post_calls(session, rpc_uri, calls)]
+
+
+class RpcBatch:
+    """
+    Collects rpc calls from multiple coroutines to be sent as a single batch.
+
+    Each enqueued call returns a future that is resolved once flushed,
+    with the call's own error set on it if it failed.
+    """
+
+    session_ref: "ReferenceType[ClientSession]"
+    rpc_uri: str
+    calls: list[TCall]
+    futures: list["asyncio.Future[str]"]
+
+    def __init__(self, session: ClientSession, rpc_uri: str):
+        self.session_ref = ref(session)
+        self.rpc_uri = rpc_uri
+        self.calls = []
+        self.futures = []
+
+    def enqueue(self, method: str, params: TParams) -> "asyncio.Future[str]":
+        """
+        Adds a call to the pending batch.
+
+        Args:
+            method: The eth method to call.
+            params: The params for the rpc call.
+
+        Returns:
+            The future of the raw hexadecimal result string.
+        """
+        future: asyncio.Future[str] = asyncio.get_running_loop().create_future()
+        self.calls.append((method, params))
+        self.futures.append(future)
+
+        return future
+
+    async def flush(self) -> None:
+        """
+        Sends all the pending calls and resolves their futures.
+        """
+        calls, futures = self.calls, self.futures
+        self.calls, self.futures = [], []
+
+        if not calls:
+            return
+
+        try:
+            session = deref_session(self.session_ref)
+            items = await post_calls(session, self.rpc_uri, calls)
+        except Exception as e:
+            for future in futures:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for future, item in zip(futures, items):
+            # Skip the calls whose callers were cancelled in the meantime
+            if future.done():
+                continue
+
+            try:
+                future.set_result(get_result(item))
+            except ValueError as e:
+                future.set_exception(e)
+
+
+class RpcBatcher:
+    """
+    Automatically batches the rpc calls made concurrently to an endpoint,
+    sending them together after a short window.
+    """
+
+    batch: RpcBatch
+    window: float
+    drain_task: Optional["asyncio.Future[None]"]
+
+    def __init__(
+        self, session: ClientSession, rpc_uri: str, window: float = BATCH_WINDOW
+    ):
+        self.batch = RpcBatch(session, rpc_uri)
+        self.window = window
+        self.drain_task = None
+
+    async def call(self, method: str, params: TParams) -> str:
+        """
+        Queues a call into the next batch and waits for its result.
+
+        Args:
+            method: The eth method to call.
+            params: The params for the rpc call.
+
+        Returns:
+            The raw hexadecimal result string.
+        """
+        future = self.batch.enqueue(method, params)
+
+        # The first call of a window schedules the drain for everyone
+        if self.drain_task is None:
+            self.drain_task = asyncio.ensure_future(self.__drain())
+
+        return await future
+
+    async def __drain(self) -> None:
+        await asyncio.sleep(self.window)
+
+        # Calls from here on go into the next window
+        self.drain_task = None
+        await self.batch.flush()
+
+
+class WsRpcClient:
+    """
+    Sends rpc calls over a single persistent websocket connection,
+    matching the responses to their calls by id.
+
+    The connection is (re)opened on demand, failing the pending calls
+    if it gets closed (or its receiver fails) before their responses arrive.
+    """
+
+    session_ref: "ReferenceType[ClientSession]"
+    wss_uri: str
+    ws: Optional[ClientWebSocketResponse]
+    receive_task: Optional["asyncio.Task[None]"]
+    pending: dict[int, "asyncio.Future[dict[str, Any]]"]
+    next_id: int
+    lock: asyncio.Lock
+
+    def __init__(self, session: ClientSession, wss_uri: str):
+        self.session_ref = ref(session)
+        self.wss_uri = wss_uri
+        self.ws = None
+        self.receive_task = None
+        self.pending = {}
+        self.next_id = 1
+        self.lock = asyncio.Lock()
+
+    async def post_calls(self, calls: list[TCall]) -> list[dict[str, Any]]:
+        """
+        Sends the rpc calls in a single frame, as a batch if more than one.
+
+        Args:
+            calls: The list of methods and params to call.
+
+        Returns:
+            The json-rpc responses in the order of the calls.
+        """
+        ws = await self.__connect()
+
+        # Ids are unique across the connection since calls are interleaved
+        request_ids = range(self.next_id, self.next_id + len(calls))
+        self.next_id += len(calls)
+
+        loop = asyncio.get_running_loop()
+        futures = [loop.create_future() for _ in calls]
+        self.pending.update(zip(request_ids, futures))
+
+        requests = [
+            encode_request(request_id, method, params)
+            for request_id, (method, params) in zip(request_ids, calls)
+        ]
+        body = requests[0] if len(requests) == 1 else b"[%s]" % b",".join(requests)
+
+        # Capped like the http requests, for responses that never come back
+        try:
+            await ws.send_str(body.decode())
+            return list(
+                await asyncio.wait_for(asyncio.gather(*futures), RPC_TIMEOUT.total)
+            )
+        finally:
+            for request_id in request_ids:
+                self.pending.pop(request_id, None)
+
+    async def __connect(self) -> ClientWebSocketResponse:
+        async with self.lock:
+            if self.ws is None or self.ws.closed:
+                session = deref_session(self.session_ref)
+                self.ws = await session.ws_connect(self.wss_uri)
+                self.receive_task = asyncio.create_task(self.__receive(self.ws))
+
+            return self.ws
+
+    async def __receive(self, ws: ClientWebSocketResponse) -> None:
+        error: Exception = ConnectionError("Websocket connection closed.")
+
+        try:
+            async for message in ws:
+                if message.type not in (WSMsgType.TEXT, WSMsgType.BINARY):
+                    continue
+
+                response = orjson.loads(message.data)
+                for item in response if isinstance(response, list) else [response]:
+                    self.__resolve(item)
+        except Exception as e:
+            error = e
+        finally:
+            # Drop the connection, as its response references the session
+            if self.ws is ws:
+                self.ws = None
+                self.receive_task = None
+            await ws.close()
+
+            # The connection is gone so nothing left pending will be answered
+            for future in self.pending.values():
+                if not future.done():
+                    future.set_exception(error)
+
+    def __resolve(self, item: Any) -> None:
+        if not isinstance(item, dict):
+            raise ValueError(f"Unexpected websocket rpc response: {item}")
+
+        # Errors without an id cannot be matched to their calls,
+        # so fan them out as the error of every pending call
+        request_id = item.get("id")
+        if request_id is None and "error" in item:
+            for pending_id, future in self.pending.items():
+                if not future.done():
+                    future.set_result({**item, "id": pending_id})
+            return
+
+        waiter = self.pending.get(request_id) if isinstance(request_id, int) else None
+        if waiter is not None and not waiter.done():
+            waiter.set_result(item)
+
+
+# Batchers by session and endpoint (holding the sessions weakly)
+_batchers: "WeakKeyDictionary[ClientSession, dict[str, RpcBatcher]]"
+_batchers = WeakKeyDictionary()
+
+
+def get_batcher(session: ClientSession, rpc_uri: str) -> RpcBatcher:
+    """
+    Gets the shared batcher for a session and endpoint.
+
+    Args:
+        session: The async client session.
+        rpc_uri: The node provider's rpc endpoint.
+
+    Returns:
+        The batcher for the session and endpoint.
+    """
+    session_batchers = _batchers.setdefault(session, {})
+    if rpc_uri not in session_batchers:
+        session_batchers[rpc_uri] = RpcBatcher(session, rpc_uri)
+
+    return session_batchers[rpc_uri]
+
+
+# Request semaphores by session
+_semaphores: "WeakKeyDictionary[ClientSession, asyncio.Semaphore]"
+_semaphores = WeakKeyDictionary()
+
+
+def get_semaphore(session: ClientSession) -> asyncio.Semaphore:
+    """
+    Gets the shared semaphore bounding the requests in flight for a session.
+
+    Args:
+        session: The async client session.
+
+    Returns:
+        The semaphore for the session.
+    """
+    if session not in _semaphores:
+        _semaphores[session] = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+    return _semaphores[session]
+
+
+# Websocket clients by session and endpoint (holding the sessions weakly)
+_ws_clients: "WeakKeyDictionary[ClientSession, dict[str, WsRpcClient]]"
+_ws_clients = WeakKeyDictionary()
+
+
+def get_ws_client(session: ClientSession, wss_uri: str) -> WsRpcClient:
+    """
+    Gets the shared websocket client for a session and endpoint.
+
+    Args:
+        session: The async client session.
+        wss_uri: The node provider's websocket endpoint.
+
+    Returns:
+        The websocket client for the session and endpoint.
+    """
+    session_clients = _ws_clients.setdefault(session, {})
+    if wss_uri not in session_clients:
+        session_clients[wss_uri] = WsRpcClient(session, wss_uri)
+
+    return session_clients[wss_uri]
@@ -1,11 +1,41 @@
 # Standard libraries
 from typing import Any, Sequence, Union
-import json
+import functools
 
 # 3rd party libraries
 from aiohttp import ClientSession
-import eth_abi
-import eth_utils
+from eth_abi.decoding import ContextFramesBytesIO, TupleDecoder
+from eth_abi.encoding import TupleEncoder
+from eth_abi.registry import registry
+
+# Code
+from .batch import get_batcher
+
+
+def hex_to_bytes(hex_str: str) -> bytes:
+    """
+    Converts a hexadecimal string, with or without the 0x prefix, to bytes.
+
+    Args:
+        hex_str: The hexadecimal string.
+
+    Returns:
+        The decoded bytes.
+    """
+    return bytes.fromhex(hex_str[2:] if hex_str.startswith("0x") else hex_str)
+
+
+def bytes_to_hex(data: bytes) -> str:
+    """
+    Converts bytes to a 0x-prefixed hexadecimal string.
+
+    Args:
+        data: The bytes to convert.
+
+    Returns:
+        The hexadecimal string.
+    """
+    return "0x" + data.hex()
 
 
 def encode_calldata(
@@ -22,10 +52,25 @@ def encode_calldata(
     Returns:
         The bytes of the encoded calldata.
     """
-    calldata: bytes = selector + eth_abi.encode_abi(types, values)
+    calldata: bytes = selector + encode_arguments(types, values)
     return calldata
 
 
+def encode_arguments(types: Sequence[str], values: Sequence[Any]) -> bytes:
+    """
+    Encodes the arguments based on the types.
+
+    Args:
+        types: The list of types of the arguments to be encoded.
+        values: The list of values of the arguments to be encoded.
+
+    Returns:
+        The bytes of the encoded arguments.
+    """
+    encoded: bytes = _get_encoder(tuple(types))(values)
+    return encoded
+
+
 def decode_result(types: list[str], result: bytes) -> Sequence[Any]:
     """
     Decodes the result based on the types.
@@ -37,11 +82,56 @@ def decode_result(types: list[str], result: bytes) -> Sequence[Any]:
     Returns:
         The list of the decoded result values.
     """
+    if not isinstance(result, bytes):
+        raise TypeError(f"The result must be bytes, not {type(result).__name__}.")
+
     decoded_result: Sequence[Any]
-    decoded_result = eth_abi.decode_abi(types, result)
+    decoded_result = _get_decoder(tuple(types))(ContextFramesBytesIO(result))
     return decoded_result
 
 
+def decode_static_results(
+    types_list: Sequence[list[str]], results: Sequence[bytes]
+) -> list[Sequence[Any]]:
+    """
+    Decodes the results of several calls in a single decoder pass.
+
+    NOTE: Only for static types, as dynamic types' offsets are relative
+          to their own result and would be misread once concatenated.
+
+    Args:
+        types_list: The list of types for each of the results to be decoded.
+        results: The bytes of each of the results.
+
+    Returns:
+        The list of the decoded result values for each of the results.
+    """
+    decoded_results = decode_result(
+        [type_str for types in types_list for type_str in types], b"".join(results)
+    )
+
+    # Split the flat values back into each result's values
+    split_results: list[Sequence[Any]] = []
+    start = 0
+    for types in types_list:
+        split_results.append(decoded_results[start : start + len(types)])
+        start += len(types)
+
+    return split_results
+
+
+@functools.lru_cache(maxsize=256)
+def _get_encoder(types: tuple[str, ...]) -> TupleEncoder:
+    # Same encoder that `eth_abi.encode_abi` builds on every call
+    return TupleEncoder(encoders=[registry.get_encoder(type_str) for type_str in types])
+
+
+@functools.lru_cache(maxsize=256)
+def _get_decoder(types: tuple[str, ...]) -> TupleDecoder:
+    # Same decoder that `eth_abi.decode_abi` builds on every call
+    return TupleDecoder(decoders=[registry.get_decoder(type_str) for type_str in types])
+
+
 async def call_eth_method(
     session: ClientSession,
     rpc_uri: str,
@@ -59,11 +149,8 @@ async def call_eth_method(
     Returns:
         The raw hexadecimal result string.
     """
-    body = {"jsonrpc": "2.0", "id": 1, "method": method, "params": params}
-    response = await session.post(rpc_uri, data=json.dumps(body))
-    json_response = await response.json()
-    result: str = json_response["result"]
-    return result
+    # Concurrent calls to the same endpoint are sent together as a batch
+    return await get_batcher(session, rpc_uri).call(method, params)
 
 
 async def make_eth_call(
@@ -83,10 +170,10 @@ async def make_eth_call(
         The response bytes.
     """
     params: list[Union[str, dict[str, str]]]
-    params = [{"to": to, "data": eth_utils.encode_hex(data)}, "latest"]
+    params = [{"to": to, "data": bytes_to_hex(data)}, "latest"]
 
     result = await call_eth_method(session, rpc_uri, "eth_call", params)
-    result_bytes: bytes = eth_utils.decode_hex(result)
+    result_bytes = hex_to_bytes(result)
 
     return result_bytes
 
@@ -111,6 +198,6 @@ async def make_eth_storage_call(
     params = (to, slot, "latest")
 
     result = await call_eth_method(session, rpc_uri, "eth_getStorageAt", params)
-    result_bytes: bytes = eth_utils.decode_hex(result)
+    result_bytes = hex_to_bytes(result)
 
     return result_bytes
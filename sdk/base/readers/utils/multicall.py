@@ -1,8 +1,14 @@
+# Standard libraries
+from typing import Optional, Sequence, Union
+from weakref import ReferenceType, WeakKeyDictionary, ref
+import asyncio
+
 # 3rd party libraries
-from eth_abi import encode_abi, decode_abi
-from eth_utils import keccak
+from aiohttp import ClientSession
 
 # Code
+from .batch import BATCH_WINDOW, deref_session
+from .calls import encode_arguments, decode_result, make_eth_call
 from .selectors import selector_from_sig
 
 # Constants
@@ -20,7 +26,7 @@ def encode_multicall_inputs(calls: list[tuple[str, bytes]]) -> bytes:
     Returns:
         The combined calldata for a multicall.
     """
-    calldata: bytes = MULTICALL_AGGREGATE_SELECTOR + encode_abi(
+    calldata: bytes = MULTICALL_AGGREGATE_SELECTOR + encode_arguments(
         MULTICALL_AGGREGATE_INPUT_TYPES, [calls]
     )
     return calldata
@@ -37,7 +43,140 @@ def decode_multicall_result(output: bytes) -> tuple[int, list[bytes]]:
     Returns:
         The block number and list of the individual call's output bytes.
     """
-    decoded_result: tuple[int, list[bytes]] = decode_abi(
-        MULTICALL_AGGREAGTE_OUTPUT_TYPES, output
-    )
-    return decoded_result
+    block_number: int
+    outputs: list[bytes]
+    block_number, outputs = decode_result(MULTICALL_AGGREAGTE_OUTPUT_TYPES, output)
+    return block_number, outputs
+
+
+class MulticallBatcher:
+    """
+    Fuses the eth_calls made concurrently through it into a single multicall
+    after a short window, so that they are all read at the same block.
+
+    Falls back to making the calls individually if the multicall fails
+    (i.e., if any of the calls reverts), for each to get its own result.
+    """
+
+    session_ref: "ReferenceType[ClientSession]"
+    rpc_uri: str
+    multicall_address: str
+    window: float
+    calls: list[tuple[str, bytes]]
+    futures: list["asyncio.Future[bytes]"]
+    drain_task: Optional["asyncio.Future[None]"]
+
+    def __init__(
+        self,
+        session: ClientSession,
+        rpc_uri: str,
+        multicall_address: str,
+        window: float = BATCH_WINDOW,
+    ):
+        self.session_ref = ref(session)
+        self.rpc_uri = rpc_uri
+        self.multicall_address = multicall_address
+        self.window = window
+        self.calls = []
+        self.futures = []
+        self.drain_task = None
+
+    async def call(self, to: str, data: bytes) -> bytes:
+        """
+        Queues a call into the next multicall and waits for its result.
+
+        Args:
+            to: The contract to call.
+            data: The encoded selector and arguments to make the call with.
+
+        Returns:
+            The response bytes.
+        """
+        future: asyncio.Future[bytes] = asyncio.get_running_loop().create_future()
+        self.calls.append((to, data))
+        self.futures.append(future)
+
+        # The first call of a window schedules the drain for everyone
+        if self.drain_task is None:
+            self.drain_task = asyncio.ensure_future(self.__drain())
+
+        return await future
+
+    async def __drain(self) -> None:
+        await asyncio.sleep(self.window)
+
+        # Calls from here on go into the next window
+        calls, futures = self.calls, self.futures
+        self.calls, self.futures, self.drain_task = [], [], None
+
+        outputs: Sequence[Union[bytes, BaseException]]
+        try:
+            outputs = await self.__make_calls(calls)
+        except Exception as e:
+            outputs = [e] * len(calls)
+
+        for future, output in zip(futures, outputs):
+            # Skip the calls whose callers were cancelled in the meantime
+            if future.done():
+                continue
+
+            if isinstance(output, BaseException):
+                future.set_exception(output)
+            else:
+                future.set_result(output)
+
+    async def __make_calls(
+        self, calls: list[tuple[str, bytes]]
+    ) -> Sequence[Union[bytes, BaseException]]:
+        session = deref_session(self.session_ref)
+
+        # Nothing to fuse for a lone call
+        if len(calls) == 1:
+            return [await make_eth_call(session, self.rpc_uri, *calls[0])]
+
+        try:
+            result = await make_eth_call(
+                session,
+                self.rpc_uri,
+                self.multicall_address,
+                encode_multicall_inputs(calls),
+            )
+        except ValueError:
+            # Let each call fail (or succeed) on its own
+            return await asyncio.gather(
+                *[make_eth_call(session, self.rpc_uri, to, data) for to, data in calls],
+                return_exceptions=True,
+            )
+
+        _, outputs = decode_multicall_result(result)
+        return outputs
+
+
+# Multicall batchers by session and endpoint (holding the sessions weakly)
+_batchers: "WeakKeyDictionary[ClientSession, dict[tuple[str, str], MulticallBatcher]]"
+_batchers = WeakKeyDictionary()
+
+
+async def make_multicall_eth_call(
+    session: ClientSession, rpc_uri: str, multicall_address: str, to: str, data: bytes
+) -> bytes:
+    """
+    Makes an eth_call like `make_eth_call`, but fused into a single multicall
+    with the other calls made concurrently to the same endpoint.
+
+    Args:
+        session: The async client session.
+        rpc_uri: The node provider's rpc endpoint.
+        multicall_address: The multicall contract to aggregate the calls with.
+        to: The contract to call.
+        data: The encoded selector and arguments to make the call with.
+
+    Returns:
+        The response bytes.
+    """
+    session_batchers = _batchers.setdefault(session, {})
+    key = (rpc_uri, multicall_address)
+    if key not in session_batchers:
+        session_batchers[key] = MulticallBatcher(session, rpc_uri, multicall_address)
+
+    return await session_batchers[key].call(to, data)
@@ -1,7 +1,11 @@
+# Standard libraries
+import functools
+
 # 3rd party libraries
 from eth_utils import keccak
 
 
+@functools.lru_cache(maxsize=None)
 def selector_from_sig(signature: str) -> bytes:
     """
     Hashes the signature to get the selector.
@@ -0,0 +1,31 @@
+# 3rd party libraries
+from aiohttp import ClientSession, TCPConnector
+
+# Constants
+SESSION_CONNECTION_LIMIT = 0  # No overall limit, only per host
+SESSION_CONNECTION_LIMIT_PER_HOST = 64
+SESSION_KEEPALIVE_TIMEOUT = 75  # seconds
+SESSION_DNS_CACHE_TTL = 300  # seconds
+
+
+def make_rpc_session() -> ClientSession:
+    """
+    Makes a client session whose connections to the node provider
+    are kept alive and reused across rpc calls.
+
+    NOTE: Should be called from within the running loop it will be used in,
+    and the session reused across reports (one per process and loop)
+    so that the TLS handshakes are not paid again on every report.
+
+    Returns:
+        The async client session.
+    """
+    return ClientSession(
+        connector=TCPConnector(
+            limit=SESSION_CONNECTION_LIMIT,
+            limit_per_host=SESSION_CONNECTION_LIMIT_PER_HOST,
+            keepalive_timeout=SESSION_KEEPALIVE_TIMEOUT,
+            ttl_dns_cache=SESSION_DNS_CACHE_TTL,
+            enable_cleanup_closed=True,
+        )
+    )
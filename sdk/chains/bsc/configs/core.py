@@ -21,6 +21,13 @@ class BscProtocolsConfig(FrozenModel):
 
 class BscConfig(GenericChainConfig[BscPricingConfig, BscProtocolsConfig]):
     def __init__(
-        self, config_path: str = "configs/bsc", rpc_uri: str = "", wss_uri: str = ""
+        self,
+        config_path: str = "configs/bsc",
+        rpc_uri: str = "",
+        wss_uri: str = "",
+        validate: bool = False,
+        read_over_wss: bool = False,
     ):
-        super().__init__(config_path, rpc_uri, wss_uri, "BNB", "WBNB")
+        super().__init__(
+            config_path, rpc_uri, wss_uri, "BNB", "WBNB", validate, read_over_wss
+        )
@@ -1,12 +1,14 @@
 # Standard libraries
-from typing import Optional
+from typing import Iterator, Optional
+import contextlib
+import functools
 import time
 
 # Code
 from sdk.lib.shortest_path_resolver import ShortestPathResolver
 from sdk.fund.types import CallType, FundTxn, FundTxns
-from sdk.base.encoders import BaseProtocolEncoder
-from sdk.base.encoders.general.erc20 import Erc20Encoder
+from sdk.base.encoders import BaseContractEncoder, BaseProtocolEncoder
+from sdk.base.encoders.general.erc20 import get_erc20_encoder
 from sdk.chains.bsc.configs import BscConfig
 from sdk.chains.bsc.configs.protocols.pancakeswap import PancakeswapPairConfig
 from .helpers.swap import PancakeswapSwapHelper
@@ -30,28 +32,100 @@ class PancakeswapEncoder(BaseProtocolEncoder):
         self.tokens = config.tokens
         self.cake_address = self._get_token_address("CAKE")
 
-        # Contract encoders
-        get_contract_encoder = self._get_contract_encoder_partial(__file__)
-        self.router = get_contract_encoder("abis/router.json")
-        self.master_chef_v2 = get_contract_encoder("abis/master_chef_v2.json")
-        self.cake_pool = get_contract_encoder("abis/cake_pool.json")
-        self.smart_chef = get_contract_encoder("abis/smart_chef.json")
-        self.erc20 = Erc20Encoder()
+        # Contract encoders (the farming ones are only loaded when first used)
+        self.__get_contract_encoder = self._get_contract_encoder_partial(__file__)
+        self.router = self.__get_contract_encoder("abis/router.json")
+        self.erc20 = get_erc20_encoder()
+
+        # Revoking the cake pool's allowance is the same call for every deposit
+        self.unapprove_cake_pool_data = self.erc20.encode_abi(
+            "approve", self.protocol.cake_pool, 0
+        )
 
         # Helpers
         self.swap_helper = PancakeswapSwapHelper(self.protocol, self.router, self.erc20)
-        self.lp_helper = PancakeswapLpHelper(
-            self.protocol, self.router, self.master_chef_v2, self.erc20
-        )
 
         # Utils
-        self.path_resolver = ShortestPathResolver(
-            pair.split("-") for pair in self.protocol.pairs.keys()
+        pair_edges: list[tuple[str, str]] = []
+        for pair_symbol in self.protocol.pairs:
+            symbol_0, symbol_1 = pair_symbol.split("-")
+            pair_edges.append((symbol_0, symbol_1))
+        self.path_resolver = ShortestPathResolver(pair_edges)
+
+        # Pairs by their symbols in either order and smart chefs by their symbols
+        self.__pairs_index = {
+            frozenset(pair_symbol.split("-")): pair
+            for pair_symbol, pair in self.protocol.pairs.items()
+        }
+        # Symbols paired with ETH, to bridge swaps between them through WETH
+        self.__eth_paired_symbols = {
+            symbol
+            for pair_key in self.__pairs_index
+            if self.config.ETH in pair_key
+            for symbol in pair_key
+            if symbol != self.config.ETH
+        }
+        self.__smart_chefs_index = {
+            tuple(symbols.split("-")): address
+            for symbols, address in self.protocol.smart_chefs.items()
+        }
+
+        # Resolved swap paths by from and to symbols, as the pairs never change
+        self.__resolved_paths: dict[tuple[str, str], tuple[str, ...]] = {}
+
+        # Current timestamp pinned for the deadlines while batching
+        self.__pinned_now: Optional[int] = None
+
+    # -----------------
+    # Lazy attributes
+    # -----------------
+    @functools.cached_property
+    def master_chef_v2(self) -> BaseContractEncoder:
+        return self.__get_contract_encoder("abis/master_chef_v2.json")
+
+    @functools.cached_property
+    def cake_pool(self) -> BaseContractEncoder:
+        return self.__get_contract_encoder("abis/cake_pool.json")
+
+    @functools.cached_property
+    def smart_chef(self) -> BaseContractEncoder:
+        return self.__get_contract_encoder("abis/smart_chef.json")
+
+    @functools.cached_property
+    def lp_helper(self) -> PancakeswapLpHelper:
+        return PancakeswapLpHelper(
+            self.protocol, self.router, self.master_chef_v2, self.erc20
         )
 
+    @functools.cached_property
+    def withdraw_all_cake_data(self) -> str:
+        # Withdrawing all from the cake pool takes no arguments
+        return self.cake_pool.encode_abi("withdrawAll")
+
     # --------------
     # Main methods
     # --------------
+    @contextlib.contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Pins the current time for the deadlines of the transactions
+        encoded within the context, reading the clock only once.
+
+        e.g.,
+            with encoder.batch():
+                txns = encoder.swap_with_exact(...) + encoder.add_liquidity(...)
+        """
+        # Nested batches keep the outermost pinned time
+        if self.__pinned_now is not None:
+            yield
+            return
+
+        self.__pinned_now = int(time.time())
+        try:
+            yield
+        finally:
+            self.__pinned_now = None
+
     def swap_with_exact(
         self,
         from_token: str,
@@ -110,6 +184,37 @@ class PancakeswapEncoder(BaseProtocolEncoder):
             deadline=deadline,
         )
 
+    def swap_with_exact_batch(
+        self,
+        swaps: list[tuple[str, str, int, int]],
+        seconds_to_deadline: int = 0,
+    ) -> FundTxns:
+        """
+        Perform many swaps where the amounts to send are exact, sharing
+        a single deadline and resolving each pair's path only once.
+
+        Args:
+            swaps: The list of each swap's from token, to token,
+                exact amount to send and minimum amount to receive.
+            seconds_to_deadline: The seconds to add to the current time
+                for the deadline (e.g. time.time() + 60 seconds).
+
+        Returns:
+            The list of encoded fund transactions of all the swaps, in order.
+        """
+        txns: FundTxns = []
+        with self.batch():
+            for from_token, to_token, exact_amount, min_amount in swaps:
+                txns += self.swap_with_exact(
+                    from_token,
+                    to_token,
+                    exact_amount,
+                    min_amount,
+                    seconds_to_deadline=seconds_to_deadline,
+                )
+
+        return txns
+
     def swap_for_exact(
         self,
         from_token: str,
@@ -283,7 +388,7 @@ class PancakeswapEncoder(BaseProtocolEncoder):
         if self._is_eth(token_1):
             return self.lp_helper.remove_liquidity_eth(
                 lp_token=pair.address,
-                token=self._get_token_address(token_1),
+                token=self._get_token_address(token_0),
                 amount_lp_token=amount_lp_token,
                 amount_token_min=amount_token_0_min,
                 amount_eth_min=amount_token_1_min,
@@ -370,11 +475,11 @@ class PancakeswapEncoder(BaseProtocolEncoder):
         Returns:
             The list of encoded fund transactions.
         """
-        allowance_data = self.erc20.encode_abi(
-            "increaseAllowance", self.protocol.cake_pool, amount
+        allowance_data = self.erc20.encode_increase_allowance(
+            self.protocol.cake_pool, amount
         )
         call_data = self.cake_pool.encode_abi("deposit", amount, duration)
-        unapprove_data = self.erc20.encode_abi("approve", self.protocol.cake_pool, 0)
+        unapprove_data = self.unapprove_cake_pool_data
 
         return [
             FundTxn(CallType.TOKEN, self.cake_address, allowance_data),
@@ -393,11 +498,11 @@ class PancakeswapEncoder(BaseProtocolEncoder):
             The list of encoded fund transactions.
         """
         if amount == 0:
-            call_data = self.cake_pool.enbode_abi("withdrawAll")
+            call_data = self.withdraw_all_cake_data
         else:
-            call_data = self.cake_pool.enbode_abi("withdrawByAmount", amount)
+            call_data = self.cake_pool.encode_abi("withdrawByAmount", amount)
 
-        return [FundTxn(CallType.PROTOCOL, self.cake_address, call_data, 0)]
+        return [FundTxn(CallType.PROTOCOL, self.protocol.cake_pool, call_data, 0)]
 
     def single_farm(
         self, staked_token: str, reward_token: str, amount: int
@@ -415,8 +520,8 @@ class PancakeswapEncoder(BaseProtocolEncoder):
         staked_token_address = self._get_token_address(staked_token)
         smart_chef_address = self.__get_smart_chef_address(staked_token, reward_token)
 
-        allowance_data = self.erc20.encode_abi(
-            "increaseAllowance", smart_chef_address, amount
+        allowance_data = self.erc20.encode_increase_allowance(
+            smart_chef_address, amount
         )
         call_data = self.smart_chef.encode_abi("deposit", amount)
         unapprove_data = self.erc20.encode_abi("approve", smart_chef_address, 0)
@@ -449,10 +554,10 @@ class PancakeswapEncoder(BaseProtocolEncoder):
     # -----------------
     # Private methods
     # -----------------
-    @staticmethod
-    def __get_deadline(seconds_to_deadline: int = 0) -> int:
+    def __get_deadline(self, seconds_to_deadline: int = 0) -> int:
         """
-        Computes the deadline timestamp based on the current time.
+        Computes the deadline timestamp based on the current time,
+        or the time pinned by the current batch.
 
         Args:
             seconds_to_deadline The seconds delta to add to the current timestamp.
@@ -460,7 +565,11 @@ class PancakeswapEncoder(BaseProtocolEncoder):
         Returns:
             The deadline timestamp.
         """
-        return int(time.time()) + (seconds_to_deadline or SECONDS_TO_DEADLINE)
+        now = self.__pinned_now
+        if now is None:
+            now = int(time.time())
+
+        return now + (seconds_to_deadline or SECONDS_TO_DEADLINE)
 
     def __get_pair_if_exists(
         self, symbol_0: str, symbol_1: str
@@ -475,15 +584,7 @@ class PancakeswapEncoder(BaseProtocolEncoder):
         Returns:
             The address of the pair.
         """
-        result: PancakeswapPairConfig
-        if self.protocol.pairs.get(f"{symbol_0}-{symbol_1}"):
-            result = self.protocol.pairs[f"{symbol_0}-{symbol_1}"]
-            return result
-        if self.protocol.pairs.get(f"{symbol_1}-{symbol_0}"):
-            result = self.protocol.pairs[f"{symbol_1}-{symbol_0}"]
-            return result
-
-        return None
+        return self.__pairs_index.get(frozenset((symbol_0, symbol_1)))
 
     def __get_smart_chef_address(self, staked_symbol: str, reward_symbol: str) -> str:
         """
@@ -500,14 +601,33 @@ class PancakeswapEncoder(BaseProtocolEncoder):
             The smart chef address.
         """
         try:
-            result: str = self.protocol.smart_chefs[f"{staked_symbol}-{reward_symbol}"]
-            return result
+            return self.__smart_chefs_index[(staked_symbol, reward_symbol)]
         except KeyError:
             raise ValueError(
                 f"{staked_symbol}-{reward_symbol} does not have a smart chef."
             )
 
     def __resolve_path(self, from_symbol: str, to_symbol: str) -> list[str]:
+        """
+        Resolves the path between two inputs, only once per pair of inputs.
+
+        Args:
+            from_symbol: The symbol of the from token.
+            to_symbol: The symbol of the to token.
+
+        Returns:
+            The path reprsented by the list of pair addresses.
+        """
+        key = (from_symbol, to_symbol)
+        path = self.__resolved_paths.get(key)
+        if path is None:
+            path = tuple(self.__find_path(from_symbol, to_symbol))
+            self.__resolved_paths[key] = path
+
+        # Fresh list each time so callers cannot alter the cached path
+        return list(path)
+
+    def __find_path(self, from_symbol: str, to_symbol: str) -> list[str]:
         """
         Find path between two inputs by either:
             1) Finding a pool with the two directly.
@@ -529,9 +649,8 @@ class PancakeswapEncoder(BaseProtocolEncoder):
             ]
 
         # Check if bnb pair exists for both tokens
-        if self.__get_pair_if_exists(
-            from_symbol, self.config.ETH
-        ) and self.__get_pair_if_exists(to_symbol, self.config.ETH):
+        eth_paired_symbols = self.__eth_paired_symbols
+        if from_symbol in eth_paired_symbols and to_symbol in eth_paired_symbols:
             return [
                 self._get_token_address(from_symbol),
                 self._get_token_address(self.config.WETH),
@@ -541,7 +660,7 @@ class PancakeswapEncoder(BaseProtocolEncoder):
         # Check if path resolver had found a path
         resolved_path = self.path_resolver.get(from_symbol, to_symbol)
         if resolved_path is not None:
-            return [self._get_token_address(symbol) for symbol in resolved_path]
+            return list(map(self._get_token_address, resolved_path))
 
         raise ValueError(
             f"Unable to resolve the token swap path for {from_symbol} > {to_symbol}."
@@ -22,6 +22,12 @@ class PancakeswapLpHelper:
         self.master_chef_v2 = master_chef_v2
         self.erc20 = erc20
 
+        # Revoking the allowances are the same calls for every operation
+        self.unapprove_router_data = erc20.encode_abi("approve", config.router, 0)
+        self.unapprove_master_chef_v2_data = erc20.encode_abi(
+            "approve", config.master_chef_v2, 0
+        )
+
     def add_liquidity_eth(
         self,
         token: str,
@@ -47,8 +53,8 @@ class PancakeswapLpHelper:
         Returns:
             The list of encoded fund transactions.
         """
-        allowance_data = self.erc20.encode_abi(
-            "increaseAllowance", self.config.router, amount_token
+        allowance_data = self.erc20.encode_increase_allowance(
+            self.config.router, amount_token
         )
         call_data = self.router.encode_abi(
             "addLiquidityETH",
@@ -59,11 +65,11 @@ class PancakeswapLpHelper:
             to,
             deadline,
         )
-        unapprove_data = self.erc20.encode_abi("approve", self.config.router, 0)
+        unapprove_data = self.unapprove_router_data
 
         return [
             FundTxn(CallType.TOKEN, self.config.router, allowance_data),
-            FundTxn(CallType.PROTOCOL, self.config.router, call_data, value=amount_eth),
+            FundTxn(CallType.PROTOCOL, self.config.router, call_data, amount_eth),
             FundTxn(CallType.TOKEN, self.config.router, unapprove_data),
         ]
 
@@ -94,11 +100,11 @@ class PancakeswapLpHelper:
         Returns:
             The list of encoded fund transactions.
         """
-        allowance_data_0 = self.erc20.encode_abi(
-            "increaseAllowance", self.config.router, amount_token_0
+        allowance_data_0 = self.erc20.encode_increase_allowance(
+            self.config.router, amount_token_0
         )
-        allowance_data_1 = self.erc20.encode_abi(
-            "increaseAllowance", self.config.router, amount_token_1
+        allowance_data_1 = self.erc20.encode_increase_allowance(
+            self.config.router, amount_token_1
         )
         call_data = self.router.encode_abi(
             "addLiquidity",
@@ -111,7 +117,7 @@ class PancakeswapLpHelper:
             to,
             deadline,
         )
-        unapprove_data = self.erc20.encode_abi("approve", self.config.router, 0)
+        unapprove_data = self.unapprove_router_data
 
         return [
             FundTxn(CallType.TOKEN, token_0, allowance_data_0),
@@ -158,7 +164,7 @@ class PancakeswapLpHelper:
             to,
             deadline,
         )
-        unapprove_data = self.erc20.encode_abi("approve", self.config.router, 0)
+        unapprove_data = self.unapprove_router_data
 
         return [
             FundTxn(CallType.PROTOCOL, lp_token, approve_data),
@@ -193,8 +199,8 @@ class PancakeswapLpHelper:
         Returns:
             The list of encoded fund transactions.
         """
-        approve_data = self.erc20.encode_abi(
-            "increaseAllowance", self.config.router, amount_lp_token
+        approve_data = self.erc20.encode_increase_allowance(
+            self.config.router, amount_lp_token
         )
         call_data = self.router.encode_abi(
             "removeLiquidity",
@@ -206,7 +212,7 @@ class PancakeswapLpHelper:
             to,
             deadline,
         )
-        unapprove_data = self.erc20.encode_abi("approve", self.config.router, 0)
+        unapprove_data = self.unapprove_router_data
 
         return [
             FundTxn(CallType.PROTOCOL, lp_token, approve_data),
@@ -230,7 +236,7 @@ class PancakeswapLpHelper:
             "approve", self.config.master_chef_v2, amount_lp_token
         )
         call_data = self.master_chef_v2.encode_abi("deposit", pid, amount_lp_token)
-        unapprove_data = self.erc20.encode_abi("approve", self.config.master_chef_v2, 0)
+        unapprove_data = self.unapprove_master_chef_v2_data
 
         return [
             FundTxn(CallType.PROTOCOL, lp_token, approve_data),
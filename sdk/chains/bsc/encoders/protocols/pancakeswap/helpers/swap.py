@@ -1,3 +1,6 @@
+# Standard libraries
+from typing import Any
+
 # Code
 from sdk.fund.types import CallType, FundTxn, FundTxns
 from sdk.base.encoders import BaseContractEncoder
@@ -20,6 +23,9 @@ class PancakeswapSwapHelper:
         self.router = router
         self.erc20 = erc20
 
+        # Revoking the router's allowance is the same call for every swap
+        self.unapprove_router_data = erc20.encode_abi("approve", config.router, 0)
+
     def swap_eth_for_exact_tokens(
         self,
         amount_eth_max: int,
@@ -46,9 +52,7 @@ class PancakeswapSwapHelper:
         )
 
         return [
-            FundTxn(
-                CallType.PROTOCOL, self.config.router, call_data, value=amount_eth_max
-            )
+            FundTxn(CallType.PROTOCOL, self.config.router, call_data, amount_eth_max)
         ]
 
     def swap_exact_eth_for_tokens(
@@ -76,9 +80,7 @@ class PancakeswapSwapHelper:
             "swapExactETHForTokens", amount_token_min, path, to, deadline
         )
         return [
-            FundTxn(
-                CallType.PROTOCOL, self.config.router, call_data, value=amount_eth_exact
-            )
+            FundTxn(CallType.PROTOCOL, self.config.router, call_data, amount_eth_exact)
         ]
 
     def swap_tokens_for_exact_eth(
@@ -102,24 +104,12 @@ class PancakeswapSwapHelper:
         Returns:
             The list of encoded fund transactions.
         """
-        allowance_data = self.erc20.encode_abi(
-            "increaseAllowance", self.config.router, amount_token_max
-        )
-        call_data = self.router.encode_abi(
+        return self.__encode_token_swap(
             "swapTokensForExactETH",
-            amount_eth_exact,
             amount_token_max,
             path,
-            to,
-            deadline,
+            (amount_eth_exact, amount_token_max, path, to, deadline),
         )
-        unapprove_data = self.erc20.encode_abi("approve", self.config.router, 0)
-
-        return [
-            FundTxn(CallType.TOKEN, path[0], allowance_data),
-            FundTxn(CallType.PROTOCOL, self.config.router, call_data),
-            FundTxn(CallType.TOKEN, path[0], unapprove_data),
-        ]
 
     def swap_exact_tokens_for_eth(
         self,
@@ -142,24 +132,12 @@ class PancakeswapSwapHelper:
         Returns:
             The list of encoded fund transactions.
         """
-        allowance_data = self.erc20.encode_abi(
-            "increaseAllowance", self.config.router, amount_token_exact
-        )
-        call_data = self.router.encode_abi(
+        return self.__encode_token_swap(
             "swapExactTokensForETH",
             amount_token_exact,
-            amount_eth_min,
             path,
-            to,
-            deadline,
+            (amount_token_exact, amount_eth_min, path, to, deadline),
         )
-        unapprove_data = self.erc20.encode_abi("approve", self.config.router, 0)
-
-        return [
-            FundTxn(CallType.TOKEN, path[0], allowance_data),
-            FundTxn(CallType.PROTOCOL, self.config.router, call_data),
-            FundTxn(CallType.TOKEN, path[0], unapprove_data),
-        ]
 
     def swap_tokens_for_exact_tokens(
         self,
@@ -182,24 +160,12 @@ class PancakeswapSwapHelper:
         Returns:
             The list of encoded fund transactions.
         """
-        allowance_data = self.erc20.encode_abi(
-            "increaseAllowance", self.config.router, amount_token_0_max
-        )
-        call_data = self.router.encode_abi(
+        return self.__encode_token_swap(
             "swapTokensForExactTokens",
-            amount_token_1_exact,
             amount_token_0_max,
             path,
-            to,
-            deadline,
+            (amount_token_1_exact, amount_token_0_max, path, to, deadline),
         )
-        unapprove_data = self.erc20.encode_abi("approve", self.config.router, 0)
-
-        return [
-            FundTxn(CallType.TOKEN, path[0], allowance_data),
-            FundTxn(CallType.PROTOCOL, self.config.router, call_data),
-            FundTxn(CallType.TOKEN, path[0], unapprove_data),
-        ]
 
     def swap_exact_tokens_for_tokens(
         self,
@@ -222,21 +188,39 @@ class PancakeswapSwapHelper:
         Returns:
             The list of encoded fund transactions.
         """
-        allowance_data = self.erc20.encode_abi(
-            "increaseAllowance", self.config.router, amount_token_0_exact
-        )
-        call_data = self.router.encode_abi(
+        return self.__encode_token_swap(
             "swapExactTokensForTokens",
             amount_token_0_exact,
-            amount_token_1_min,
             path,
-            to,
-            deadline,
+            (amount_token_0_exact, amount_token_1_min, path, to, deadline),
+        )
+
+    # -----------------
+    # Private methods
+    # -----------------
+    def __encode_token_swap(
+        self, fn_name: str, amount_token: int, path: list[str], args: tuple[Any, ...]
+    ) -> FundTxns:
+        """
+        Encodes a swap spending the path's first token, wrapped between
+        increasing and revoking the router's allowance of the token.
+
+        Args:
+            fn_name: The name of the router's swap function.
+            amount_token: The (max) amount of the token to be used in the swap.
+            path: The token swap path.
+            args: The arguments of the router's swap function.
+
+        Returns:
+            The list of encoded fund transactions.
+        """
+        allowance_data = self.erc20.encode_increase_allowance(
+            self.config.router, amount_token
         )
-        unapprove_data = self.erc20.encode_abi("approve", self.config.router, 0)
+        call_data = self.router.encode_abi(fn_name, *args)
 
         return [
             FundTxn(CallType.TOKEN, path[0], allowance_data),
             FundTxn(CallType.PROTOCOL, self.config.router, call_data),
-            FundTxn(CallType.TOKEN, path[0], unapprove_data),
+            FundTxn(CallType.TOKEN, path[0], self.unapprove_router_data),
         ]
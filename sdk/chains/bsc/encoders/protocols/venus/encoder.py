@@ -2,7 +2,7 @@
 from sdk.fund.types import CallType, FundTxn, FundTxns
 from sdk.base.encoders import BaseProtocolEncoder
 from sdk.chains.bsc.configs import BscConfig
-from sdk.base.encoders.general.erc20 import Erc20Encoder
+from sdk.base.encoders.general.erc20 import get_erc20_encoder
 
 
 class VenusEncoder(BaseProtocolEncoder):
@@ -17,6 +17,7 @@ class VenusEncoder(BaseProtocolEncoder):
         self.protocol = config.protocols.venus
         self.tokens = config.tokens
         self.xvs_address = self._get_token_address("XVS")
+        self.__pools = self.protocol.pools
 
         # Contract encoders
         get_contract_encoder = self._get_contract_encoder_partial(__file__)
@@ -24,7 +25,13 @@ class VenusEncoder(BaseProtocolEncoder):
         self.comptroller_g5 = get_contract_encoder("abis/comptroller_g5.json")
         self.vbnb = get_contract_encoder("abis/vbnb.json")
         self.vbep20 = get_contract_encoder("abis/vbep20.json")
-        self.erc20 = Erc20Encoder()
+        self.erc20 = get_erc20_encoder()
+
+        # Revoking a pool's allowance is the same call for every operation
+        self.unapprove_pool_datas = {
+            pool_address: self.erc20.encode_abi("approve", pool_address, 0)
+            for pool_address in self.protocol.pools.values()
+        }
 
     # --------------
     # Main methods
@@ -52,7 +59,7 @@ class VenusEncoder(BaseProtocolEncoder):
             The list of encoded fund transactions.
         """
         # Lookup pool addresses
-        addresses = [self.__get_pool_address(symbol) for symbol in token_symbols]
+        addresses = list(map(self.__get_pool_address, token_symbols))
 
         call_data = self.comptroller_g5.encode_abi("enterMarkets", addresses)
 
@@ -69,7 +76,7 @@ class VenusEncoder(BaseProtocolEncoder):
             The list of encoded fund transactions.
         """
         # Lookup pool addresses
-        addresses = [self.__get_pool_address(symbol) for symbol in token_symbols]
+        addresses = list(map(self.__get_pool_address, token_symbols))
 
         return [
             FundTxn(
@@ -105,11 +112,9 @@ class VenusEncoder(BaseProtocolEncoder):
         pool_address = self.__get_pool_address(token_symbol)
         token_address = self._get_token_address(token_symbol)
 
-        allowance_data = self.erc20.encode_abi(
-            "increaseAllowance", pool_address, amount
-        )
+        allowance_data = self.erc20.encode_increase_allowance(pool_address, amount)
         call_data = self.vbep20.encode_abi("mint", amount)
-        unapprove_data = self.erc20.encode_abi("approve", pool_address, 0)
+        unapprove_data = self.unapprove_pool_datas[pool_address]
 
         return [
             FundTxn(CallType.TOKEN, token_address, allowance_data),
@@ -178,11 +183,9 @@ class VenusEncoder(BaseProtocolEncoder):
         pool_address = self.__get_pool_address(token_symbol)
         token_address = self._get_token_address(token_symbol)
 
-        allowance_data = self.erc20.encode_abi(
-            "increaseAllowance", pool_address, amount
-        )
+        allowance_data = self.erc20.encode_increase_allowance(pool_address, amount)
         call_data = self.vbep20.encode_abi("repayBorrow", amount)
-        unapprove_data = self.erc20.encode_abi("approve", pool_address, 0)
+        unapprove_data = self.unapprove_pool_datas[pool_address]
 
         return [
             FundTxn(CallType.TOKEN, token_address, allowance_data),
@@ -195,7 +198,7 @@ class VenusEncoder(BaseProtocolEncoder):
     # -----------------
     def __get_pool_address(self, symbol: str) -> str:
         try:
-            result: str = self.protocol.pools[symbol]
+            result: str = self.__pools[symbol]
             return result
         except KeyError:
             raise ValueError(f"{symbol} does not have a lending pool")
@@ -1,5 +1,5 @@
 # Standard libraries
-from typing import Optional
+from typing import Any, Optional
 
 # Code
 from sdk.fund.types import CallType, FundTxn, FundTxns
@@ -23,6 +23,12 @@ class PancakeswapLpFarmingUtilEncoder(BaseProtocolEncoder):
         # Util Contract
         self.contract = self._get_contract_encoder(__file__)
 
+        # Pairs by their symbols in either order
+        self.__pairs_index = {
+            frozenset(pair_symbol.split("-")): pair
+            for pair_symbol, pair in self.pancakeswap.pairs.items()
+        }
+
     def lp_farm(
         self,
         token_0: str,
@@ -53,44 +59,39 @@ class PancakeswapLpFarmingUtilEncoder(BaseProtocolEncoder):
         if not pair:
             raise ValueError("Liquidity pool for input pair does not exist")
 
+        # Resolve the function and its arguments struct, then encode once
+        args: tuple[Any, ...]
+
         # Token 0 is ETH
         if self._is_eth(token_0):
-            call_data = self.contract.encode_abi(
-                "farmTokenAndETH",
-                (
-                    self._get_token_address(token_1),
-                    amount_token_1,
-                    amount_token_0,
-                    amount_token_1_min,
-                    amount_token_0_min,
-                    pair.pid,
-                    farm_all_balance,
-                ),
+            fn_name = "farmTokenAndETH"
+            args = (
+                self._get_token_address(token_1),
+                amount_token_1,
+                amount_token_0,
+                amount_token_1_min,
+                amount_token_0_min,
+                pair.pid,
+                farm_all_balance,
             )
 
-            return [FundTxn(CallType.UTIL, self.address, call_data)]
-
         # Token 1 is ETH
-        if self._is_eth(token_1):
-            call_data = self.contract.encode_abi(
-                "farmTokenAndETH",
-                (
-                    self._get_token_address(token_0),
-                    amount_token_0,
-                    amount_token_1,
-                    amount_token_0_min,
-                    amount_token_1_min,
-                    pair.pid,
-                    farm_all_balance,
-                ),
+        elif self._is_eth(token_1):
+            fn_name = "farmTokenAndETH"
+            args = (
+                self._get_token_address(token_0),
+                amount_token_0,
+                amount_token_1,
+                amount_token_0_min,
+                amount_token_1_min,
+                pair.pid,
+                farm_all_balance,
             )
 
-            return [FundTxn(CallType.UTIL, self.address, call_data)]
-
         # Both are tokens
-        call_data = self.contract.encode_abi(
-            "farmTokens",
-            (
+        else:
+            fn_name = "farmTokens"
+            args = (
                 self._get_token_address(token_0),
                 self._get_token_address(token_1),
                 amount_token_0,
@@ -99,8 +100,9 @@ class PancakeswapLpFarmingUtilEncoder(BaseProtocolEncoder):
                 amount_token_1_min,
                 pair.pid,
                 farm_all_balance,
-            ),
-        )
+            )
+
+        call_data = self.contract.encode_abi(fn_name, args)
 
         return [FundTxn(CallType.UTIL, self.address, call_data)]
 
@@ -130,48 +132,44 @@ class PancakeswapLpFarmingUtilEncoder(BaseProtocolEncoder):
         if not pair:
             raise ValueError("Liquidity pool for input pair does not exist")
 
+        # Resolve the function and its arguments struct, then encode once
+        args: tuple[Any, ...]
+
         # Token 0 is ETH
         if self._is_eth(token_0):
-            call_data = self.contract.encode_abi(
-                "unfarmTokenAndETH",
-                (
-                    self._get_token_address(token_1),
-                    amount_lp_token,
-                    amount_token_1_min,
-                    amount_token_0_min,
-                    pair.pid,
-                ),
+            fn_name = "unfarmTokenAndETH"
+            args = (
+                self._get_token_address(token_1),
+                amount_lp_token,
+                amount_token_1_min,
+                amount_token_0_min,
+                pair.pid,
             )
 
-            return [FundTxn(CallType.UTIL, self.address, call_data)]
-
         # Token 1 is ETH
-        if self._is_eth(token_1):
-            call_data = self.contract.encode_abi(
-                "unfarmTokenAndETH",
-                (
-                    self._get_token_address(token_0),
-                    amount_lp_token,
-                    amount_token_0_min,
-                    amount_token_1_min,
-                    pair.pid,
-                ),
+        elif self._is_eth(token_1):
+            fn_name = "unfarmTokenAndETH"
+            args = (
+                self._get_token_address(token_0),
+                amount_lp_token,
+                amount_token_0_min,
+                amount_token_1_min,
+                pair.pid,
             )
 
-            return [FundTxn(CallType.UTIL, self.address, call_data)]
-
         # Both are tokens
-        call_data = self.contract.encode_abi(
-            "unfarmTokens",
-            (
+        else:
+            fn_name = "unfarmTokens"
+            args = (
                 self._get_token_address(token_0),
                 self._get_token_address(token_1),
                 amount_lp_token,
                 amount_token_0_min,
                 amount_token_1_min,
                 pair.pid,
-            ),
-        )
+            )
+
+        call_data = self.contract.encode_abi(fn_name, args)
 
         return [FundTxn(CallType.UTIL, self.address, call_data)]
 
@@ -191,12 +189,4 @@ class PancakeswapLpFarmingUtilEncoder(BaseProtocolEncoder):
         Returns:
             The address of the pair.
         """
-        result: PancakeswapPairConfig
-        if self.pancakeswap.pairs.get(f"{symbol_0}-{symbol_1}"):
-            result = self.pancakeswap.pairs[f"{symbol_0}-{symbol_1}"]
-            return result
-        if self.pancakeswap.pairs.get(f"{symbol_1}-{symbol_0}"):
-            result = self.pancakeswap.pairs[f"{symbol_1}-{symbol_0}"]
-            return result
-
-        return None
+        return self.__pairs_index.get(frozenset((symbol_0, symbol_1)))
@@ -1,25 +1,60 @@
+# Standard libraries
+from typing import cast
+
 # Code
-from sdk.base.readers.prices import ChainlinkPriceReader
+from sdk.base.readers.prices import ChainlinkPriceReader, IPriceReader
 from sdk.chains.bsc.configs import BscConfig
 from sdk.chains.bsc.readers.prices.pancakeswap.reader import PancakeswapPriceReader
 from sdk.chains.bsc.readers.protocols.pancakeswap.reader import PancakeswapReportReader
 from sdk.chains.bsc.readers.protocols.venus.reader import VenusReportReader
-from .types import IBscAggregator
+from .types import IBscAggregator, IBscProtocolReportReader
 
+# Protocol report readers and price readers (both by their ids)
+BscReaders = tuple[dict[str, IBscProtocolReportReader], dict[str, IPriceReader]]
 
-class BscAggregator(IBscAggregator):
-    """
-    Specialized aggregator for bsc.
-    """
+# Readers of the most recently used configs by their ids, along with the configs
+# to check that a hit was built for the very same config object
+READERS_CACHE_SIZE = 4
+_readers_cache: dict[int, tuple[BscConfig, BscReaders]] = {}
 
-    def __init__(self, config: BscConfig) -> None:
+
+def _get_readers(config: BscConfig) -> BscReaders:
+    # Keyed by identity since the configs hold unhashable dicts
+    cached = _readers_cache.pop(id(config), None)
+    readers = cached[1] if cached is not None and cached[0] is config else None
+
+    if readers is None:
         protocol_report_readers = {
             "pancakeswap": PancakeswapReportReader(config),
             "venus": VenusReportReader(config),
         }
         price_readers = [ChainlinkPriceReader(config), PancakeswapPriceReader(config)]
+        readers = (
+            cast(dict[str, IBscProtocolReportReader], protocol_report_readers),
+            {reader.id: reader for reader in price_readers},
+        )
+
+        # Evict the least recently used config's readers
+        if len(_readers_cache) >= READERS_CACHE_SIZE:
+            del _readers_cache[next(iter(_readers_cache))]
+
+    # (Re-)insert as the most recently used
+    _readers_cache[id(config)] = (config, readers)
+
+    return readers
+
+
+class BscAggregator(IBscAggregator):
+    """
+    Specialized aggregator for bsc.
+    """
+
+    def __init__(self, config: BscConfig, price_ttl_ms: int = 0) -> None:
+        # The readers are stateless so aggregators on the same config share them
+        protocol_report_readers, price_readers = _get_readers(config)
         super().__init__(
             config=config,
-            protocol_report_readers=protocol_report_readers,
-            price_readers={reader.id: reader for reader in price_readers},
+            protocol_report_readers=dict(protocol_report_readers),
+            price_readers=price_readers,
+            price_ttl_ms=price_ttl_ms,
         )
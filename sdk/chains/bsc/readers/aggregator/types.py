@@ -11,8 +11,10 @@ from sdk.chains.bsc.readers.protocols.venus.types import (
     VenusPricedDetails,
 )
 from sdk.base.readers.aggregator import BaseAggregator
+from sdk.base.readers.protocols import IProtocolReportReader
 
 
 BscDetails = Union[PancakeswapDetails, VenusDetails]
 BscPricedDetails = Union[PancakeswapPricedDetails, VenusPricedDetails]
 IBscAggregator = BaseAggregator[BscDetails, BscPricedDetails]
+IBscProtocolReportReader = IProtocolReportReader[BscDetails, BscPricedDetails]
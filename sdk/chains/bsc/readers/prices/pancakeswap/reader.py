@@ -5,12 +5,13 @@ import asyncio
 from aiohttp import ClientSession
 
 # Code
-from sdk.lib.numbers import Number, LongShortNumbers
+from sdk.lib.numbers import Number, LongShortNumbers, rescale
 from sdk.base.configs import GenericTokenConfig
 from sdk.base.readers.constants import POSITION_DECIMALS, PRICE_DECIMALS
 from sdk.base.readers.prices import IPriceReader, IPriceResolver
 from sdk.base.readers.structs import PositionsDict
-from sdk.base.readers.utils.calls import make_eth_call, decode_result
+from sdk.base.readers.utils.calls import decode_result
+from sdk.base.readers.utils.multicall import make_multicall_eth_call
 from sdk.base.readers.utils.selectors import selector_from_sig
 from sdk.chains.bsc.configs import BscConfig
 from sdk.chains.bsc.configs.prices import PancakeswapPricingConfig
@@ -20,6 +21,7 @@ from sdk.chains.bsc.configs.prices import PancakeswapPricingConfig
 # -----------
 # Pair.getReserves
 PAIR_GET_RESERVES_OUTPUT_TYPES = ["uint256", "uint256", "uint256"]
+PAIR_GET_RESERVES_OUTPUT_SIZE = 32 * len(PAIR_GET_RESERVES_OUTPUT_TYPES)
 PAIR_GET_RESERVES_SELECTOR = selector_from_sig("getReserves()")
 
 
@@ -33,6 +35,7 @@ class PancakeswapPriceReader(IPriceReader):
     """
 
     id = "pancakeswap"
+    position_dependent = True
 
     def __init__(self, config: BscConfig):
         self.config = config
@@ -45,6 +48,18 @@ class PancakeswapPriceReader(IPriceReader):
             if token.pricing.id == self.id:
                 self.tokens[symbol] = token
 
+        # Pair address, index, quote symbol and the decimals of both by symbol
+        self.__pricing_params: dict[str, tuple[str, int, str, int, int]] = {
+            symbol: (
+                token.pricing.address,
+                token.pricing.index,
+                token.pricing.quote,
+                token.decimals,
+                self.__get_decimals(token.pricing.quote),
+            )
+            for symbol, token in self.tokens.items()
+        }
+
     def get_upstream_dependencies(self, upstream_positions: PositionsDict) -> set[str]:
         """
         Resolves the upstream dependencies that need to be included.
@@ -70,62 +85,83 @@ class PancakeswapPriceReader(IPriceReader):
         Returns:
             The price for the symbol.
         """
-        token = self.tokens[symbol]
+        (
+            pair_address,
+            pair_index,
+            quote_symbol,
+            token_decimals,
+            quote_decimals,
+        ) = self.__pricing_params[symbol]
         token_net_position = position.net
-        quote_symbol = token.pricing.quote
-        quote_price = await price_resolver.resolve_price(quote_symbol, session)
-        quote_decimals = (
-            self.config.tokens[quote_symbol].decimals
-            if quote_symbol != self.config.ETH
-            else 18
-        )
 
-        # Make the call
-        result = await make_eth_call(
-            session,
-            self.config.rpc_uri,
-            token.pricing.address,
-            PAIR_GET_RESERVES_SELECTOR,
+        # Queue the reserves straight away so that every symbol's call lands
+        # in the same multicall, instead of waiting on the quote price first
+        quote_price, result = await asyncio.gather(
+            price_resolver.resolve_price(quote_symbol, session),
+            make_multicall_eth_call(
+                session,
+                self.config.read_uri,
+                self.config.multicall_address,
+                pair_address,
+                PAIR_GET_RESERVES_SELECTOR,
+            ),
         )
 
-        # Decode the result
+        # Decode the result (three static words, so slice the reserves directly
+        # and only leave unexpected results to the decoder to raise on)
         reserve_x_int: int
         reserve_y_int: int
-        reserve_x_int, reserve_y_int, _ = decode_result(
-            PAIR_GET_RESERVES_OUTPUT_TYPES, result
-        )
+        if len(result) == PAIR_GET_RESERVES_OUTPUT_SIZE:
+            reserve_x_int = int.from_bytes(result[:32], "big")
+            reserve_y_int = int.from_bytes(result[32:64], "big")
+        else:
+            reserve_x_int, reserve_y_int, _ = decode_result(
+                PAIR_GET_RESERVES_OUTPUT_TYPES, result
+            )
 
         # We are finding how much `y` can we get for our position of `x`
         # `x` is the token of interest and `y` is the quote currency
         # Flip `x` and `y` if the index is 1 to make x the token of interest
-        if token.pricing.index == 1:
+        if pair_index == 1:
             reserve_x_int, reserve_y_int = reserve_y_int, reserve_x_int
 
-        # Form them into the `Number` struct
-        reserve_x = Number(value=reserve_x_int, decimals=token.decimals)
-        reserve_x.set_decimals(POSITION_DECIMALS)
-        reserve_y = Number(value=reserve_y_int, decimals=quote_decimals)
-        reserve_y.set_decimals(POSITION_DECIMALS)
+        # Work on the raw integers at the position decimals, as the `Number`
+        # operations would, only wrapping the final price
+        reserve_x = rescale(reserve_x_int, token_decimals, POSITION_DECIMALS)
+        reserve_y = rescale(reserve_y_int, quote_decimals, POSITION_DECIMALS)
+        position_value = token_net_position.value
+        position_decimals = token_net_position.decimals
 
         # If no positions held, simply take the ratio as the price
         # as it is unimportant to us since we have no position.
-        effective_price: Number
-        if token_net_position.value == 0:
-            effective_price = (reserve_y // reserve_x).set_decimals(PRICE_DECIMALS)
+        if position_value == 0:
+            price = reserve_y * 10**POSITION_DECIMALS // reserve_x
 
         # Otherwise compute the effective liquidation price for entire holding
         else:
             # Find the units of `y` we would get from selling all of our `x`
-            # Our position in `x` being `delta_x`
-            constant_k = reserve_x * reserve_y
-            units_y = reserve_y - constant_k // (reserve_x + token_net_position)
+            # Our position in `x` being `delta_x` (summed at the higher decimals)
+            constant_k = reserve_x * reserve_y // 10**POSITION_DECIMALS
+            sum_decimals = max(POSITION_DECIMALS, position_decimals)
+            scale_x = 10 ** (sum_decimals - POSITION_DECIMALS)
+            scale_position = 10 ** (sum_decimals - position_decimals)
+            reserve_x_after = reserve_x * scale_x + position_value * scale_position
+            units_y = reserve_y - constant_k * 10**sum_decimals // reserve_x_after
 
             # Estimate token of interest's effective price in the quote currency
-            effective_price = (units_y // token_net_position).set_decimals(
-                PRICE_DECIMALS
-            )
+            price = units_y * 10**position_decimals // position_value
 
         # Estimate the denominated effective price (preserve the price decimals)
-        effective_price = effective_price * quote_price
+        effective_price = Number._from_raw(
+            value=(
+                rescale(price, POSITION_DECIMALS, PRICE_DECIMALS)
+                * quote_price.value
+                // 10**quote_price.decimals
+            ),
+            decimals=PRICE_DECIMALS,
+        )
 
         return effective_price
+
+    def __get_decimals(self, symbol: str) -> int:
+        return self.config.tokens[symbol].decimals if symbol != self.ETH else 18
@@ -6,7 +6,7 @@ import asyncio
 from aiohttp import ClientSession
 
 # Code
-from sdk.lib.numbers import Number, LongShortNumbers
+from sdk.lib.numbers import Number, LongShortNumbers, rescale
 from sdk.base.readers.constants import POSITION_DECIMALS, PRICE_DECIMALS
 from sdk.base.readers.structs import (
     PositionsDict,
@@ -15,11 +15,11 @@ from sdk.base.readers.structs import (
     PricedPositionsDict,
 )
 from sdk.base.readers.utils.calls import (
-    make_eth_call,
     encode_calldata,
     decode_result,
 )
 from sdk.base.readers.utils.multicall import (
+    make_multicall_eth_call,
     encode_multicall_inputs,
     decode_multicall_result,
 )
@@ -39,9 +39,8 @@ from .types import (
 # -----------
 # Constants
 # -----------
-# Pair.token0
-TOKEN_0_OUTPUT_TYPES = ["address"]
-TOKEN_0_SELECTOR = selector_from_sig("token0()")
+# Pancakeswap uses 18 decimals for PancakePair
+PAIR_DECIMALS = 18
 # Pair.pendingCake
 PAIR_PENDING_CAKE_INPUT_TYPES = ["uint256", "address"]
 PAIR_PENDING_CAKE_OUTPUT_TYPES = ["uint256"]
@@ -78,6 +77,28 @@ class PancakeswapReportReader(IPancakeswapReportReader):
         self.protocol = config.protocols.pancakeswap
         self.tokens = config.tokens
         self.ETH = config.ETH
+        self.WETH = config.WETH
+
+        # The calls only depend on the config so they are encoded once
+        self.__lp_calldatas = {
+            pair_symbol: self.__encode_lp_calldata(pair_symbol)
+            for pair_symbol in self.protocol.pairs.keys()
+        }
+        self.__smart_chef_calldata = encode_calldata(
+            SMART_CHEF_USER_INFO_SELECTOR,
+            SMART_CHEF_USER_INFO_INPUT_TYPES,
+            [config.fund_address],
+        )
+
+        # Symbols and their decimals by pair (in the pair's order) and by smart chef
+        self.__pair_tokens = {
+            pair_symbol: self.__get_pair_symbols_and_decimals(pair_symbol)
+            for pair_symbol in self.protocol.pairs.keys()
+        }
+        self.__smart_chef_tokens = {
+            smart_chef_symbol: self.__get_symbols_and_decimals(smart_chef_symbol)
+            for smart_chef_symbol in self.protocol.smart_chefs.keys()
+        }
 
     # --------
     # Report
@@ -91,8 +112,8 @@ class PancakeswapReportReader(IPancakeswapReportReader):
         Returns:
             The pancakeswap protocol report.
         """
-        combined_positions = PositionsDict()
-        combined_details = PancakeswapDetails(lps={}, smart_chefs={})
+        positions_to_combine: list[PositionsDict] = []
+        combined_details = PancakeswapDetails.construct(lps={}, smart_chefs={})
 
         # Start fetching lps details
         pair_symbols = self.protocol.pairs.keys()
@@ -118,7 +139,7 @@ class PancakeswapReportReader(IPancakeswapReportReader):
             positions, lp_details = lp_result
             if lp_details is None:
                 continue
-            combined_positions += positions
+            positions_to_combine.append(positions)
             combined_details.lps[symbol] = lp_details
 
         # Record the smart chef results
@@ -126,29 +147,46 @@ class PancakeswapReportReader(IPancakeswapReportReader):
         for symbol, positions in zip(smart_chef_symbols, smart_chef_results):
             if not positions:
                 continue
-            combined_positions += positions
+            positions_to_combine.append(positions)
             combined_details.smart_chefs[symbol] = positions
 
-        return PancakeswapReport(positions=combined_positions, details=combined_details)
+        combined_report: PancakeswapReport = PancakeswapReport.construct(
+            positions=PositionsDict.sum(positions_to_combine), details=combined_details
+        )
+        return combined_report
 
-    async def __fetch_lp_snapshot(
-        self, pair_symbol: str, session: ClientSession
-    ) -> tuple[PositionsDict, Optional[PancakeswapLpDetails]]:
+    def __get_pair_symbols_and_decimals(
+        self, pair_symbol: str
+    ) -> tuple[str, str, int, int]:
+        symbol_0, symbol_1, decimals_0, decimals_1 = self.__get_symbols_and_decimals(
+            pair_symbol
+        )
+
+        # Pairs order their tokens by address, with ETH held as WETH
+        address_0 = self.tokens[self.WETH if symbol_0 == self.ETH else symbol_0].address
+        address_1 = self.tokens[self.WETH if symbol_1 == self.ETH else symbol_1].address
+        if int(address_0, 16) > int(address_1, 16):
+            return symbol_1, symbol_0, decimals_1, decimals_0
+
+        return symbol_0, symbol_1, decimals_0, decimals_1
+
+    def __get_symbols_and_decimals(self, symbols: str) -> tuple[str, str, int, int]:
         # Parse the symbols
-        symbol_0, symbol_1 = pair_symbol.split("-")
+        symbol_0, symbol_1 = symbols.split("-")
 
         # Retrieve the decimals
         decimals_0 = self.tokens[symbol_0].decimals if symbol_0 != self.ETH else 18
         decimals_1 = self.tokens[symbol_1].decimals if symbol_1 != self.ETH else 18
 
+        return symbol_0, symbol_1, decimals_0, decimals_1
+
+    def __encode_lp_calldata(self, pair_symbol: str) -> bytes:
         # Retrieve the pair
         pair = self.protocol.pairs[pair_symbol]
 
         # Encode the arguments into a multicall
-        multicall_calldata = encode_multicall_inputs(
+        multicall_calldata: bytes = encode_multicall_inputs(
             [
-                # Token 0
-                (pair.address, TOKEN_0_SELECTOR),
                 # Cake rewards
                 (
                     self.protocol.master_chef_v2,
@@ -183,68 +221,92 @@ class PancakeswapReportReader(IPancakeswapReportReader):
             ]
         )
 
+        return multicall_calldata
+
+    async def __fetch_lp_snapshot(
+        self, pair_symbol: str, session: ClientSession
+    ) -> tuple[PositionsDict, Optional[PancakeswapLpDetails]]:
+        # Retrieve the symbols and decimals
+        symbol_0, symbol_1, decimals_0, decimals_1 = self.__pair_tokens[pair_symbol]
+
         # Make the call and decode the multicall outputs
-        result = await make_eth_call(
+        result = await make_multicall_eth_call(
             session,
-            self.config.rpc_uri,
+            self.config.read_uri,
+            self.config.multicall_address,
             self.config.multicall_address,
-            multicall_calldata,
+            self.__lp_calldatas[pair_symbol],
         )
         _, outputs = decode_multicall_result(result)
 
-        # Decode the individual outputs
-        token_0_address: str
-        cake_accrued_rewards_int: int
-        reserve_0_int: int
-        reserve_1_int: int
-        total_supply_int: int
+        # Decode the balances first (NOTE: outputs are in the order of the calls)
         holding_balance_int: int
         farming_balance_int: int
-        (token_0_address,) = decode_result(TOKEN_0_OUTPUT_TYPES, outputs[0])
-        (cake_accrued_rewards_int,) = decode_result(
-            PAIR_PENDING_CAKE_OUTPUT_TYPES, outputs[1]
-        )
-        (reserve_0_int, reserve_1_int, _) = decode_result(
-            PAIR_GET_RESERVES_OUTPUT_TYPES, outputs[2]
-        )
-        (total_supply_int,) = decode_result(PAIR_TOTAL_SUPPLY_OUTPUT_TYPES, outputs[3])
-        (holding_balance_int,) = decode_result(PAIR_BALANCE_OF_OUTPUT_TYPES, outputs[4])
+        (holding_balance_int,) = decode_result(PAIR_BALANCE_OF_OUTPUT_TYPES, outputs[3])
         (farming_balance_int, *_) = decode_result(
-            MASTER_CHEF_V2_USER_INFO_OUTPUT_TYPES, outputs[5]
+            MASTER_CHEF_V2_USER_INFO_OUTPUT_TYPES, outputs[4]
         )
 
         # Return None since there is nothing to compute/structure
         if holding_balance_int == 0 and farming_balance_int == 0:
             return PositionsDict(), None
 
-        # Flip the symbols and decimals if in wrong order before computing
-        if self.tokens[symbol_0].address != token_0_address:
-            symbol_0, symbol_1 = symbol_1, symbol_0
-            decimals_0, decimals_1 = decimals_1, decimals_0
-
-        # Parse the outputs into the `Number` struct
+        # Decode the rest of the outputs only for the pairs held
+        cake_accrued_rewards_int: int
+        reserve_0_int: int
+        reserve_1_int: int
+        total_supply_int: int
+        (cake_accrued_rewards_int,) = decode_result(
+            PAIR_PENDING_CAKE_OUTPUT_TYPES, outputs[0]
+        )
+        (reserve_0_int, reserve_1_int, _) = decode_result(
+            PAIR_GET_RESERVES_OUTPUT_TYPES, outputs[1]
+        )
+        (total_supply_int,) = decode_result(PAIR_TOTAL_SUPPLY_OUTPUT_TYPES, outputs[2])
+
+        # Computations on the raw integers, rounding as the `Number` operations
+        # would (NOTE: the shares carry the pair's decimals)
+        pair_unit = 10**PAIR_DECIMALS
+        holding_share = holding_balance_int * pair_unit // total_supply_int
+        farming_share = farming_balance_int * pair_unit // total_supply_int
+        holding_balance_0_int = reserve_0_int * holding_share // pair_unit
+        holding_balance_1_int = reserve_1_int * holding_share // pair_unit
+        farming_balance_0_int = reserve_0_int * farming_share // pair_unit
+        farming_balance_1_int = reserve_1_int * farming_share // pair_unit
+
+        # Parse the results into the `Number` struct
         cake_accrued_rewards = Number(
             value=cake_accrued_rewards_int, decimals=self.tokens["CAKE"].decimals
         )
-        reserve_0 = Number(value=reserve_0_int, decimals=decimals_0)
-        reserve_1 = Number(value=reserve_1_int, decimals=decimals_1)
-        # Pancakeswap uses 18 decimals for PancakePair
-        total_supply = Number(value=total_supply_int, decimals=18)
-        holding_balance = Number(value=holding_balance_int, decimals=18)
-        farming_balance = Number(value=farming_balance_int, decimals=18)
-
-        # Computations (NOTE: order matters to preserve the relevent decimals value)
-        holding_share = holding_balance // total_supply
-        farming_share = farming_balance // total_supply
-        holding_balance_0 = reserve_0 * holding_share
-        holding_balance_1 = reserve_1 * holding_share
-        farming_balance_0 = reserve_0 * farming_share
-        farming_balance_1 = reserve_1 * farming_share
+        holding_balance = Number._from_raw(
+            value=holding_balance_int, decimals=PAIR_DECIMALS
+        )
+        farming_balance = Number._from_raw(
+            value=farming_balance_int, decimals=PAIR_DECIMALS
+        )
+        holding_balance_0 = Number._from_raw(
+            value=holding_balance_0_int, decimals=decimals_0
+        )
+        holding_balance_1 = Number._from_raw(
+            value=holding_balance_1_int, decimals=decimals_1
+        )
+        farming_balance_0 = Number._from_raw(
+            value=farming_balance_0_int, decimals=decimals_0
+        )
+        farming_balance_1 = Number._from_raw(
+            value=farming_balance_1_int, decimals=decimals_1
+        )
 
         # Aggregations
-        total_balance = holding_balance + farming_balance
-        total_balance_0 = holding_balance_0 + farming_balance_0
-        total_balance_1 = holding_balance_1 + farming_balance_1
+        total_balance = Number._from_raw(
+            value=holding_balance_int + farming_balance_int, decimals=PAIR_DECIMALS
+        )
+        total_balance_0 = Number._from_raw(
+            value=holding_balance_0_int + farming_balance_0_int, decimals=decimals_0
+        )
+        total_balance_1 = Number._from_raw(
+            value=holding_balance_1_int + farming_balance_1_int, decimals=decimals_1
+        )
 
         # Structuring
         positions_dict = PositionsDict(
@@ -257,7 +319,7 @@ class PancakeswapReportReader(IPancakeswapReportReader):
             }
         )
 
-        report = PancakeswapLpDetails(
+        report = PancakeswapLpDetails.construct(
             cake_accrued_rewards=cake_accrued_rewards,
             holding={
                 "lp_token": holding_balance,
@@ -284,26 +346,24 @@ class PancakeswapReportReader(IPancakeswapReportReader):
         """
         Makes a single call to a smart chef to get the balance.
         """
-        # Parse the symbols
-        staked_symbol, reward_symbol = smart_chef_symbol.split("-")
-
-        # Retrieve the decimals
-        staked_decimals = self.tokens[staked_symbol].decimals
-        reward_decimals = self.tokens[reward_symbol].decimals
+        # Retrieve the symbols and decimals
+        (
+            staked_symbol,
+            reward_symbol,
+            staked_decimals,
+            reward_decimals,
+        ) = self.__smart_chef_tokens[smart_chef_symbol]
 
         # Retrieve the smart chef address
         smart_chef_address = self.protocol.smart_chefs[smart_chef_symbol]
 
-        # Encode the arguments and form the calldata
-        calldata = encode_calldata(
-            SMART_CHEF_USER_INFO_SELECTOR,
-            SMART_CHEF_USER_INFO_INPUT_TYPES,
-            [self.config.fund_address],
-        )
-
         # Await the result
-        result = await make_eth_call(
-            session, self.config.rpc_uri, smart_chef_address, calldata
+        result = await make_multicall_eth_call(
+            session,
+            self.config.read_uri,
+            self.config.multicall_address,
+            smart_chef_address,
+            self.__smart_chef_calldata,
         )
 
         # Decode the result
@@ -347,23 +407,26 @@ class PancakeswapReportReader(IPancakeswapReportReader):
         report = await self.get_report(session)
 
         price_resolver.update_positions(report.positions)
-        prices = await price_resolver.resolve_prices(report.positions.keys(), session)
+        prices = await price_resolver.resolve_prices(tuple(report.positions), session)
 
         # Price the positions
-        priced_positions_dict = PricedPositionsDict()
-        total_value = LongShortNumbers()
-        for symbol in report.positions.keys():
-            priced_positions_dict[symbol] = PricedPosition(
-                amount=report.positions[symbol],
-                value=report.positions[symbol].broadcast_mul(prices[symbol]),
-            )
-            total_value += priced_positions_dict[symbol].value
+        priced_positions_dict = PricedPositionsDict(
+            {
+                symbol: PricedPosition.construct(
+                    amount=amount, value=amount.broadcast_mul(prices[symbol])
+                )
+                for symbol, amount in report.positions.items()
+            }
+        )
+        total_value = LongShortNumbers.sum(
+            priced_position.value for priced_position in priced_positions_dict.values()
+        )
 
         # Price the lp details
         lp_priced_details_dict: dict[str, PancakeswapLpPricedDetails] = {}
         for symbol, lp_details in report.details.lps.items():
-            lp_priced_details_dict[symbol] = PancakeswapLpPricedDetails(
-                cake_accrued_rewards=PricedNetPosition(
+            lp_priced_details_dict[symbol] = PancakeswapLpPricedDetails.construct(
+                cake_accrued_rewards=PricedNetPosition.construct(
                     amount=lp_details.cake_accrued_rewards,
                     value=lp_details.cake_accrued_rewards * prices["CAKE"],
                 ),
@@ -375,49 +438,53 @@ class PancakeswapReportReader(IPancakeswapReportReader):
         # Price the smart chef details
         smart_chef_priced_details_dict: dict[str, dict[str, PricedNetPosition]] = {}
         for symbol, smart_chef_details in report.details.smart_chefs.items():
-            smart_chef_priced_details_dict[
-                symbol
-            ] = self.__tag_prices_on_smart_chef_details(smart_chef_details, prices)
+            smart_chef_priced_details_dict[symbol] = self.__tag_prices_on_amounts(
+                smart_chef_details, prices
+            )
 
-        return PancakeswapPricedReport(
+        priced_report: PancakeswapPricedReport = PancakeswapPricedReport.construct(
             value=total_value,
             positions=priced_positions_dict,
-            details=PancakeswapPricedDetails(
+            details=PancakeswapPricedDetails.construct(
                 lps=lp_priced_details_dict, smart_chefs=smart_chef_priced_details_dict
             ),
         )
+        return priced_report
 
     def __tag_prices_on_lp_details(
         self, sub_details_dict: dict[str, Number], prices: dict[str, Number]
     ) -> dict[str, PricedNetPosition]:
-        output: dict[str, PricedNetPosition] = {}
-        lp_token_value = Number()
-        for symbol in sub_details_dict.keys() - {"lp_token"}:
-            current_amount = sub_details_dict[symbol].set_decimals(POSITION_DECIMALS)
-            current_value = current_amount * prices[symbol]
-            current_value.set_decimals(PRICE_DECIMALS)
-
-            output[symbol] = PricedNetPosition(
-                amount=sub_details_dict[symbol], value=current_value
-            )
-            lp_token_value += output[symbol].value
+        output = self.__tag_prices_on_amounts(
+            {
+                symbol: amount
+                for symbol, amount in sub_details_dict.items()
+                if symbol != "lp_token"
+            },
+            prices,
+        )
 
-        output["lp_token"] = PricedNetPosition(
-            amount=sub_details_dict["lp_token"], value=lp_token_value
+        # The lp token is valued as the sum of its underlyings
+        output["lp_token"] = PricedNetPosition.construct(
+            amount=sub_details_dict["lp_token"],
+            value=Number.sum(position.value for position in output.values()),
         )
         return output
 
-    def __tag_prices_on_smart_chef_details(
-        self, details_dict: dict[str, Number], prices: dict[str, Number]
+    def __tag_prices_on_amounts(
+        self, amounts_dict: dict[str, Number], prices: dict[str, Number]
     ) -> dict[str, PricedNetPosition]:
         output: dict[str, PricedNetPosition] = {}
-        for symbol in details_dict.keys():
-            current_amount = details_dict[symbol].set_decimals(POSITION_DECIMALS)
-            current_value = current_amount * prices[symbol]
-            current_value.set_decimals(PRICE_DECIMALS)
-
-            output[symbol] = PricedNetPosition(
-                amount=details_dict[symbol], value=current_value
+        for symbol, amount in amounts_dict.items():
+            amount.set_decimals(POSITION_DECIMALS)
+            price = prices[symbol]
+
+            # Same as multiplying the `Number`s and rounding to the price decimals
+            value_int = amount.value * price.value // 10**price.decimals
+            value = Number._from_raw(
+                value=rescale(value_int, POSITION_DECIMALS, PRICE_DECIMALS),
+                decimals=PRICE_DECIMALS,
             )
 
+            output[symbol] = PricedNetPosition.construct(amount=amount, value=value)
+
         return output
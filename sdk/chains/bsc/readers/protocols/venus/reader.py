@@ -4,20 +4,20 @@ import asyncio
 
 # 3rd party libraries
 from aiohttp import ClientSession
-from eth_utils import to_checksum_address
 
 # Code
-from sdk.lib.numbers import Number, LongShortNumbers
+from sdk.lib.numbers import Number, LongShortNumbers, rescale
 from sdk.base.readers.constants import PERCENT_DECIMALS, PRICE_DECIMALS
 from sdk.base.readers.prices import IPriceResolver
 from sdk.base.readers.structs import PositionsDict, PricedPosition, PricedPositionsDict
 from sdk.base.readers.utils.calls import (
-    make_eth_call,
     make_eth_storage_call,
     encode_calldata,
     decode_result,
+    decode_static_results,
 )
 from sdk.base.readers.utils.multicall import (
+    make_multicall_eth_call,
     encode_multicall_inputs,
     decode_multicall_result,
 )
@@ -66,6 +66,14 @@ LENS_XVS_BALANCE_OUTPUT_TYPES = ["(uint256,uint256,address,uint256)"]
 LENS_XVS_BALANCE_SELECTOR = selector_from_sig(
     "getXVSBalanceMetadataExt(address,address,address)"
 )
+# Pool snapshot multicall outputs, in order of the calls
+POOL_SNAPSHOT_OUTPUT_TYPES = [
+    UNITROLLER_MARKETS_OUTPUT_TYPES,
+    POOL_BALANCE_OF_UNDERLYING_OUTPUT_TYPES,
+    POOL_BORROW_BALANCE_STORED_OUTPUT_TYPES,
+    POOL_SUPPLY_RATE_PER_BLOCK_OUTPUT_TYPES,
+    POOL_BORROW_RATE_PER_BLOCK_OUTPUT_TYPES,
+]
 
 
 class VenusReportReader(IVenusReportReader):
@@ -86,6 +94,33 @@ class VenusReportReader(IVenusReportReader):
             "address", config.fund_address, 16
         )
 
+        # Lowercased pool addresses to match the markets entered against,
+        # without having to checksum the decoded addresses on every report
+        self.__lower_pool_addresses = {
+            underlying_symbol: address.lower()
+            for underlying_symbol, address in self.protocol.pools.items()
+        }
+
+        # The calls only depend on the config so they are encoded once
+        self.__pool_calldatas = {
+            underlying_symbol: self.__encode_pool_calldata(underlying_symbol)
+            for underlying_symbol in self.protocol.pools.keys()
+        }
+        self.__assets_in_calldata = encode_calldata(
+            UNITROLLER_GET_ASSETS_IN_SELECTOR,
+            UNITROLLER_GET_ASSETS_IN_INPUT_TYPES,
+            [config.fund_address],
+        )
+        self.__rewards_accrued_calldata = encode_calldata(
+            LENS_XVS_BALANCE_SELECTOR,
+            LENS_XVS_BALANCE_INPUT_TYPES,
+            [
+                self.tokens["XVS"].address,
+                self.protocol.unitroller,
+                config.fund_address,
+            ],
+        )
+
     # --------
     # Report
     # --------
@@ -99,7 +134,8 @@ class VenusReportReader(IVenusReportReader):
         Returns:
             The venus protocol report.
         """
-        combined_positions = PositionsDict()
+        # Positions are summed once at the end rather than merged pool by pool
+        positions_to_combine: list[PositionsDict] = []
 
         # Get rewards accrued
         rewards_accrued_task = asyncio.create_task(
@@ -121,7 +157,7 @@ class VenusReportReader(IVenusReportReader):
         # Record the rewards accrued
         rewards_accrued = await rewards_accrued_task
         if rewards_accrued:
-            combined_positions["XVS"] = rewards_accrued
+            positions_to_combine.append(PositionsDict(XVS=rewards_accrued))
 
         # Instantiate the combiend details with the rewards accrued
         combined_details = VenusDetails(xvs_accrued_rewards=rewards_accrued.net)
@@ -132,46 +168,44 @@ class VenusReportReader(IVenusReportReader):
         for symbol, pool_result in zip(underlying_symbols, pool_results):
             positions, pool_snapshot = pool_result
             if pool_snapshot is not None:
-                combined_positions += positions
-                pool_details = VenusPoolDetails(
-                    **pool_snapshot.dict(),
-                    is_collateral=self.protocol.pools[symbol] in assets_in_results,
+                positions_to_combine.append(positions)
+                # The snapshot was just built so its fields need no revalidation
+                pool_details = VenusPoolDetails.construct(
+                    **pool_snapshot.__dict__,
+                    is_collateral=(
+                        self.__lower_pool_addresses[symbol] in assets_in_results
+                    ),
                 )
                 combined_details.pools[symbol] = pool_details
 
-        return VenusReport(positions=combined_positions, details=combined_details)
-
-    async def __fetch_assets_in(self, session: ClientSession) -> set[str]:
-        calldata = encode_calldata(
-            UNITROLLER_GET_ASSETS_IN_SELECTOR,
-            UNITROLLER_GET_ASSETS_IN_INPUT_TYPES,
-            [self.config.fund_address],
+        combined_report: VenusReport = VenusReport.construct(
+            positions=PositionsDict.sum(positions_to_combine), details=combined_details
         )
+        return combined_report
 
-        result = await make_eth_call(
-            session, self.config.rpc_uri, self.protocol.unitroller, calldata
+    async def __fetch_assets_in(self, session: ClientSession) -> set[str]:
+        result = await make_multicall_eth_call(
+            session,
+            self.config.read_uri,
+            self.config.multicall_address,
+            self.protocol.unitroller,
+            self.__assets_in_calldata,
         )
 
         markets_entered: Sequence[str]
         (markets_entered,) = decode_result(
             UNITROLLER_GET_ASSETS_IN_OUTPUT_TYPES, result
         )
-        return set(to_checksum_address(address) for address in markets_entered)
+        return {address.lower() for address in markets_entered}
 
     async def __fetch_rewards_accrued(self, session: ClientSession) -> LongShortNumbers:
         xvs = self.tokens["XVS"]
-        calldata = encode_calldata(
-            LENS_XVS_BALANCE_SELECTOR,
-            LENS_XVS_BALANCE_INPUT_TYPES,
-            [
-                xvs.address,
-                self.protocol.unitroller,
-                self.config.fund_address,
-            ],
-        )
-
-        result = await make_eth_call(
-            session, self.config.rpc_uri, self.protocol.lens, calldata
+        result = await make_multicall_eth_call(
+            session,
+            self.config.read_uri,
+            self.config.multicall_address,
+            self.protocol.lens,
+            self.__rewards_accrued_calldata,
         )
 
         allocated: int
@@ -180,21 +214,12 @@ class VenusReportReader(IVenusReportReader):
         xvs_value = Number(value=allocated, decimals=xvs.decimals)
         return LongShortNumbers(net=xvs_value, long=xvs_value)
 
-    async def __fetch_pool_snapshot(
-        self, session: ClientSession, underlying_symbol: str
-    ) -> tuple[PositionsDict, Optional[VenusPoolSnapshot]]:
+    def __encode_pool_calldata(self, underlying_symbol: str) -> bytes:
         # Retrieve the pool address
         pool_address = self.protocol.pools[underlying_symbol]
 
-        # Retrieve the decimals
-        token_decimals = (
-            self.tokens[underlying_symbol].decimals
-            if underlying_symbol != self.ETH
-            else 18
-        )
-
         # Form the multicall calldata
-        multicall_calldata = encode_multicall_inputs(
+        multicall_calldata: bytes = encode_multicall_inputs(
             [
                 # Collateral factor
                 (
@@ -230,46 +255,57 @@ class VenusReportReader(IVenusReportReader):
             ]
         )
 
-        # Make the call and decode the multicall outputs
-        result = await make_eth_call(
-            session,
-            self.config.rpc_uri,
-            self.config.multicall_address,
-            multicall_calldata,
+        return multicall_calldata
+
+    async def __fetch_pool_snapshot(
+        self, session: ClientSession, underlying_symbol: str
+    ) -> tuple[PositionsDict, Optional[VenusPoolSnapshot]]:
+        # Retrieve the pool address
+        pool_address = self.protocol.pools[underlying_symbol]
+
+        # Retrieve the decimals
+        token_decimals = (
+            self.tokens[underlying_symbol].decimals
+            if underlying_symbol != self.ETH
+            else 18
+        )
+
+        # Read the borrowed principal's storage alongside the multicall,
+        # rather than in a second round trip once the balances are known
+        result, borrow_principal_balance_bytes = await asyncio.gather(
+            make_multicall_eth_call(
+                session,
+                self.config.read_uri,
+                self.config.multicall_address,
+                self.config.multicall_address,
+                self.__pool_calldatas[underlying_symbol],
+            ),
+            make_eth_storage_call(
+                session, self.config.read_uri, pool_address, self.borrow_principal_slot
+            ),
         )
         _, outputs = decode_multicall_result(result)
 
-        # Decode the indvidual outputs
+        # Decode the indvidual outputs (all static, so in a single pass)
         collateral_factor_int: int
         supply_balance_int: int
         borrow_balance_int: int
         supply_rate_per_block_int: int
         borrow_rate_per_block_int: int
 
-        (_, collateral_factor_int, _) = decode_result(
-            UNITROLLER_MARKETS_OUTPUT_TYPES, outputs[0]
-        )
-        (supply_balance_int,) = decode_result(
-            POOL_BALANCE_OF_UNDERLYING_OUTPUT_TYPES, outputs[1]
-        )
-        (borrow_balance_int,) = decode_result(
-            POOL_BORROW_BALANCE_STORED_OUTPUT_TYPES, outputs[2]
-        )
-        (supply_rate_per_block_int,) = decode_result(
-            POOL_SUPPLY_RATE_PER_BLOCK_OUTPUT_TYPES, outputs[3]
-        )
-        (borrow_rate_per_block_int,) = decode_result(
-            POOL_BORROW_RATE_PER_BLOCK_OUTPUT_TYPES, outputs[4]
-        )
+        (
+            (_, collateral_factor_int, _),
+            (supply_balance_int,),
+            (borrow_balance_int,),
+            (supply_rate_per_block_int,),
+            (borrow_rate_per_block_int,),
+        ) = decode_static_results(POOL_SNAPSHOT_OUTPUT_TYPES, outputs)
 
         # Return None since there is nothing to compute/structure
         if supply_balance_int == 0 and borrow_balance_int == 0:
             return PositionsDict(), None
 
-        # Read the storage for borrowed principal
-        borrow_principal_balance_bytes = await make_eth_storage_call(
-            session, self.config.rpc_uri, pool_address, self.borrow_principal_slot
-        )
+        # Decode the storage for borrowed principal
         borrow_principal_balance_int: int = decode_result(
             ["uint256"], borrow_principal_balance_bytes
         )[0]
@@ -280,7 +316,7 @@ class VenusReportReader(IVenusReportReader):
         # Structuring
         positions_dict = PositionsDict(
             {
-                underlying_symbol: LongShortNumbers(
+                underlying_symbol: LongShortNumbers.construct(
                     net=Number(
                         value=supply_balance_int - borrow_balance_int,
                         decimals=token_decimals,
@@ -291,7 +327,8 @@ class VenusReportReader(IVenusReportReader):
             }
         )
 
-        pool_snapshot = VenusPoolSnapshot(
+        # Every field is set from the decoded ints, so skip the validation
+        pool_snapshot = VenusPoolSnapshot.construct(
             supply_balance=Number(value=supply_balance_int, decimals=token_decimals),
             borrow_balance=Number(value=borrow_balance_int, decimals=token_decimals),
             borrow_principal_balance=Number(
@@ -330,24 +367,28 @@ class VenusReportReader(IVenusReportReader):
         report = await self.get_report(session)
 
         price_resolver.update_positions(report.positions)
-        prices = await price_resolver.resolve_prices(report.positions.keys(), session)
+        prices = await price_resolver.resolve_prices(tuple(report.positions), session)
 
         # Price the positions
-        priced_positions_dict = PricedPositionsDict()
-        total_value = LongShortNumbers()
-        for symbol in report.positions.keys():
-            priced_positions_dict[symbol] = PricedPosition(
-                amount=report.positions[symbol],
-                value=report.positions[symbol].broadcast_mul(prices[symbol]),
-            )
-            total_value += priced_positions_dict[symbol].value
+        priced_positions_dict = PricedPositionsDict(
+            {
+                symbol: PricedPosition.construct(
+                    amount=amount, value=amount.broadcast_mul(prices[symbol])
+                )
+                for symbol, amount in report.positions.items()
+            }
+        )
+        total_value = LongShortNumbers.sum(
+            priced_position.value for priced_position in priced_positions_dict.values()
+        )
 
         # Price the details
         priced_details = self.__tag_details_with_prices(report.details, prices)
 
-        return VenusPricedReport(
+        priced_report: VenusPricedReport = VenusPricedReport.construct(
             value=total_value, positions=priced_positions_dict, details=priced_details
         )
+        return priced_report
 
     def __tag_details_with_prices(
         self, details: VenusDetails, prices: dict[str, Number]
@@ -357,69 +398,93 @@ class VenusReportReader(IVenusReportReader):
             # All other fields default to Value(0, 0)
             return VenusPricedDetails(xvs_accrued_rewards=details.xvs_accrued_rewards)
 
-        # Compute the details values (work in 18 decimals)
-        total_supply_value = Number(value=0, decimals=18)
-        total_borrow_value = Number(value=0, decimals=18)
-        total_collateral_value = Number(value=0, decimals=18)
+        # Compute the details values on the raw integers (work in 18 decimals)
+        total_supply_value = 0
+        total_borrow_value = 0
+        total_collateral_value = 0
+        borrow_limit = 0
         pools_with_values: dict[str, VenusPoolPricedDetails] = {}
-        borrow_limit = Number(value=0, decimals=18)
 
         for symbol, pool in details.pools.items():
-            # Make a copy of the values for computations
-            supply_balance = pool.supply_balance.copy().set_decimals(18)
-            borrow_balance = pool.borrow_balance.copy().set_decimals(18)
-            borrow_principal_value = pool.borrow_principal_balance.copy().set_decimals(
-                18
-            )
-            borrow_interest_value = pool.borrow_interest_balance.copy().set_decimals(18)
-            collateral_factor = pool.collateral_factor.copy().set_decimals(18)
+            price = prices[symbol]
+            price_value, price_scale = price.value, 10**price.decimals
 
             # Track the supply and borrow values
-            supply_value = supply_balance * prices[symbol]
-            borrow_value = borrow_balance * prices[symbol]
-            borrow_principal_value = borrow_principal_value * prices[symbol]
-            borrow_interest_value = borrow_interest_value * prices[symbol]
+            supply_value = self.__to_value(
+                pool.supply_balance, price_value, price_scale
+            )
+            borrow_value = self.__to_value(
+                pool.borrow_balance, price_value, price_scale
+            )
+            borrow_principal_value = self.__to_value(
+                pool.borrow_principal_balance, price_value, price_scale
+            )
+            borrow_interest_value = self.__to_value(
+                pool.borrow_interest_balance, price_value, price_scale
+            )
             total_supply_value += supply_value
             total_borrow_value += borrow_value
 
             # Update collateral details if enabled as collateral
             if pool.is_collateral:
-                collateral_value = supply_value
-                borrow_limit += collateral_value * collateral_factor
-                total_collateral_value += collateral_value
+                collateral_factor = pool.collateral_factor
+                borrow_limit += (
+                    supply_value
+                    * rescale(collateral_factor.value, collateral_factor.decimals, 18)
+                    // 10**18
+                )
+                total_collateral_value += supply_value
 
             # Track the detailed pools
-            pools_with_values[symbol] = VenusPoolPricedDetails(
-                **pool.dict(),
-                supply_value=supply_value,
-                borrow_value=borrow_value,
-                borrow_principal_value=borrow_principal_value,
-                borrow_interest_value=borrow_interest_value,
+            pools_with_values[symbol] = VenusPoolPricedDetails.construct(
+                **pool.__dict__,
+                supply_value=Number._from_raw(value=supply_value, decimals=18),
+                borrow_value=Number._from_raw(value=borrow_value, decimals=18),
+                borrow_principal_value=Number._from_raw(
+                    value=borrow_principal_value, decimals=18
+                ),
+                borrow_interest_value=Number._from_raw(
+                    value=borrow_interest_value, decimals=18
+                ),
             )
 
-        max_loan_to_collateral_percent = borrow_limit // total_collateral_value
-        loan_to_value_percent = total_borrow_value // total_supply_value
-        loan_to_liquidation_percent = total_borrow_value // borrow_limit
-
-        # Set the values to price decimals
-        total_supply_value.set_decimals(PRICE_DECIMALS)
-        total_borrow_value.set_decimals(PRICE_DECIMALS)
-        total_collateral_value.set_decimals(PRICE_DECIMALS)
-        borrow_limit.set_decimals(PRICE_DECIMALS)
-
-        # Set percents to precent decimals
-        max_loan_to_collateral_percent.set_decimals(PERCENT_DECIMALS)
-        loan_to_value_percent.set_decimals(PERCENT_DECIMALS)
-        loan_to_liquidation_percent.set_decimals(PERCENT_DECIMALS)
+        # Percents are divided at 18 decimals before being set to percent decimals
+        max_loan_to_collateral_percent = (
+            borrow_limit * 10**18 // total_collateral_value
+        )
+        loan_to_value_percent = total_borrow_value * 10**18 // total_supply_value
+        loan_to_liquidation_percent = total_borrow_value * 10**18 // borrow_limit
 
         return VenusPricedDetails(
             xvs_accrued_rewards=details.xvs_accrued_rewards,
-            total_supply_value=total_supply_value,
-            total_borrow_value=total_borrow_value,
-            total_collateral_value=total_collateral_value,
-            borrow_limit=borrow_limit,
-            max_loan_to_collateral_percent=max_loan_to_collateral_percent,
-            loan_to_collateral_percent=loan_to_value_percent,
-            loan_to_liquidation_percent=loan_to_liquidation_percent,
+            total_supply_value=self.__to_number(total_supply_value, PRICE_DECIMALS),
+            total_borrow_value=self.__to_number(total_borrow_value, PRICE_DECIMALS),
+            total_collateral_value=self.__to_number(
+                total_collateral_value, PRICE_DECIMALS
+            ),
+            borrow_limit=self.__to_number(borrow_limit, PRICE_DECIMALS),
+            max_loan_to_collateral_percent=self.__to_number(
+                max_loan_to_collateral_percent, PERCENT_DECIMALS
+            ),
+            loan_to_collateral_percent=self.__to_number(
+                loan_to_value_percent, PERCENT_DECIMALS
+            ),
+            loan_to_liquidation_percent=self.__to_number(
+                loan_to_liquidation_percent, PERCENT_DECIMALS
+            ),
             pools=pools_with_values,
         )
+
+    @staticmethod
+    def __to_value(balance: Number, price_value: int, price_scale: int) -> int:
+        """
+        Values a balance at 18 decimals, as `balance.set_decimals(18) * price` would.
+        """
+        return rescale(balance.value, balance.decimals, 18) * price_value // price_scale
+
+    @staticmethod
+    def __to_number(value: int, target: int) -> Number:
+        """
+        Wraps a raw 18 decimals integer into a number at the target decimals.
+        """
+        return Number._from_raw(value=rescale(value, 18, target), decimals=target)
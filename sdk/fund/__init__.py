@@ -1 +1 @@
-from .fund import Fund
+from .fund import Fund, BatchTransactionError
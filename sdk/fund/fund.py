@@ -1,19 +1,44 @@
+# Standard libraries
+from typing import Any, Optional
+
 # 3rd party libraries
 from eth_account.account import LocalAccount, SignedTransaction
-from web3 import Web3
+from web3 import Web3, HTTPProvider
+from web3._utils.request import make_post_request
 from web3.contract import Contract, ChecksumAddress
 from hexbytes import HexBytes
+import orjson
 
 # Code
 from sdk.lib.utils import load_abi
 from sdk.lib.logger import SdkLogger
 from sdk.base.configs import BaseConfig
 from sdk.base.connector import BaseConnector
-from .types import FundTxn
+from .types import FundTxn, FundTxns
 
 
 # Constants
 DEFAULT_GAS_PER_TXN = 180_000
+DEFAULT_GAS_PRICE = Web3.toWei(5, "gwei")
+# Rejections meaning the locally tracked nonce went stale
+STALE_NONCE_ERRORS = ("nonce too low", "replacement transaction underpriced")
+
+
+class BatchTransactionError(ValueError):
+    """
+    Raised when some transactions of a batch failed to be sent,
+    keeping the hashes of those that were sent.
+    """
+
+    tx_hashes: list[Optional[HexBytes]]
+    errors: dict[int, Any]
+
+    def __init__(self, tx_hashes: list[Optional[HexBytes]], errors: dict[int, Any]):
+        super().__init__(
+            f"{len(errors)} of {len(tx_hashes)} transactions failed: {errors}"
+        )
+        self.tx_hashes = tx_hashes
+        self.errors = errors
 
 
 class Fund:
@@ -26,6 +51,7 @@ class Fund:
     __operator: LocalAccount
     __contract: Contract
     __logger: SdkLogger
+    __next_nonce: Optional[int]
 
     def __init__(self, config: BaseConfig, connector: BaseConnector, operator_key: str):
         self.config = config
@@ -36,6 +62,9 @@ class Fund:
         )
         self.__logger = SdkLogger(f"{self.__class__.__name__}")
 
+        # Fetched on the first transaction and incremented locally after
+        self.__next_nonce = None
+
         assert self.connector.is_connected()
 
     @property
@@ -43,7 +72,7 @@ class Fund:
         return self.__contract.address
 
     def call(
-        self, txn: FundTxn, gas_limit: int = 0, gas_price: int = Web3.toWei(5, "gwei")
+        self, txn: FundTxn, gas_limit: int = 0, gas_price: int = DEFAULT_GAS_PRICE
     ) -> HexBytes:
         """
         Sends a transction via call
@@ -61,21 +90,18 @@ class Fund:
 
         # Convert the struct back to a regular tuple for a single txn
         call_data = self.__contract.encodeABI("call", tuple(txn))
-        signed_txn = self.__sign(call_data, gas_limit, gas_price)
 
         self.__logger.info(f"Sending [call] transaction to {txn.call_address}")
         self.__logger.debug("Call Data: {!r}".format(txn.call_data))
         self.__logger.debug(f"Value: {txn.value}")
 
-        return self.connector.connection.eth.send_raw_transaction(
-            signed_txn.rawTransaction
-        )
+        return self.__sign_and_send(call_data, gas_limit, gas_price)
 
     def multi_call(
         self,
         txns: list[FundTxn],
         gas_limit: int = 0,
-        gas_price: int = Web3.toWei(5, "gwei"),
+        gas_price: int = DEFAULT_GAS_PRICE,
         name_in_logs: str = "No Name",
     ) -> HexBytes:
         """
@@ -94,7 +120,6 @@ class Fund:
             gas_limit = DEFAULT_GAS_PER_TXN * len(txns)
 
         call_data = self.__contract.encodeABI("multiCall", [txns])
-        signed_txn = self.__sign(call_data, gas_limit, gas_price)
 
         self.__logger.info(f"Name of Call: {name_in_logs}")
         self.__logger.info(
@@ -103,21 +128,177 @@ class Fund:
         self.__logger.debug(f"Call Datas: {[txn.call_data for txn in txns]}")
         self.__logger.debug(f"Values: {[txn.value for txn in txns]}")
 
-        return self.connector.connection.eth.send_raw_transaction(
-            signed_txn.rawTransaction
-        )
+        return self.__sign_and_send(call_data, gas_limit, gas_price)
+
+    def multi_call_batch(
+        self,
+        groups: list[FundTxns],
+        gas_limit: int = 0,
+        gas_price: int = DEFAULT_GAS_PRICE,
+        name_in_logs: str = "No Name",
+    ) -> list[HexBytes]:
+        """
+        Sends each group of transactions as its own multi call,
+        broadcasting all of them in a single batch request.
+
+         Args:
+            groups: The list of lists of encoded transctions to send.
+            gas_limit: The maximum gas to consume per group.
+            gas_price: The cost per unit of gas in gwei.
+            name_in_logs: The name of this batch of calls to show in the logs.
+         Returns:
+            The transaction hashes in the order of the groups.
+         Raises:
+            BatchTransactionError: If some of the transactions failed to be sent,
+                with the hashes of the sent ones and the errors of the others.
+        """
+        # Reserve a nonce for each group at once
+        nonce = self.__reserve_nonces(len(groups))
+
+        # Sent transactions are kept in the error (see `BatchTransactionError`)
+        try:
+            raw_txns: list[HexBytes] = []
+            for i, txns in enumerate(groups):
+                # If gas limit is not set, overquote with {DEFAULT_GAS_PER_TXN} * txns
+                group_gas_limit = gas_limit or DEFAULT_GAS_PER_TXN * len(txns)
+
+                call_data = self.__contract.encodeABI("multiCall", [txns])
+                signed_txn = self.__sign(
+                    call_data, group_gas_limit, gas_price, nonce + i
+                )
+                raw_txns.append(signed_txn.rawTransaction)
+
+            self.__logger.info(f"Name of Call: {name_in_logs}")
+            self.__logger.info(
+                f"Sending {len(groups)} [multiCall] transactions to "
+                f"{[[txn.call_address for txn in txns] for txns in groups]}"
+            )
+
+            return self.__send_raw_transactions(raw_txns)
+        except Exception:
+            # Resync as the unsent transactions' nonces were not consumed
+            self.__next_nonce = None
+            raise
 
     # -----------------
     # Private methods
     # -----------------
-    def __sign(
+    def __sign_and_send(
         self, call_data: bytes, gas_limit: int, gas_price: int
+    ) -> HexBytes:
+        try:
+            return self.__sign_and_send_once(call_data, gas_limit, gas_price)
+        except ValueError as e:
+            # Retry once (with the resynced nonce) if it was the one rejected
+            if not any(error in str(e).lower() for error in STALE_NONCE_ERRORS):
+                raise
+
+        return self.__sign_and_send_once(call_data, gas_limit, gas_price)
+
+    def __sign_and_send_once(
+        self, call_data: bytes, gas_limit: int, gas_price: int
+    ) -> HexBytes:
+        try:
+            signed_txn = self.__sign(call_data, gas_limit, gas_price)
+            tx_hash: HexBytes = self.connector.connection.eth.send_raw_transaction(
+                signed_txn.rawTransaction
+            )
+            return tx_hash
+        except Exception:
+            # Resync as the reserved nonce was not consumed
+            self.__next_nonce = None
+            raise
+
+    def __reserve_nonces(self, count: int = 1) -> int:
+        # Only fetch the nonce when not tracked yet (including pending txns)
+        if self.__next_nonce is None:
+            self.__next_nonce = self.connector.connection.eth.get_transaction_count(
+                self.__operator.address, "pending"
+            )
+
+        nonce = self.__next_nonce
+        self.__next_nonce += count
+        return nonce
+
+    def __send_raw_transactions(self, raw_txns: list[HexBytes]) -> list[HexBytes]:
+        provider = self.connector.connection.provider
+        tx_hashes: list[Optional[HexBytes]] = [None] * len(raw_txns)
+        errors: dict[int, Any] = {}
+
+        # Only http endpoints take batch requests here, so send the rest one by one
+        if not isinstance(provider, HTTPProvider):
+            for i, raw_txn in enumerate(raw_txns):
+                try:
+                    tx_hashes[i] = self.connector.connection.eth.send_raw_transaction(
+                        raw_txn
+                    )
+                except Exception as e:
+                    errors[i] = e
+                    # The later nonces would only be gapped, so stop at the failure
+                    for j in range(i + 1, len(raw_txns)):
+                        errors[j] = "Not sent."
+                    break
+
+            return self.__check_sent(tx_hashes, errors)
+
+        if provider.endpoint_uri is None:
+            raise ValueError("The http provider has no endpoint to send the batch to.")
+
+        body = [
+            {
+                "jsonrpc": "2.0",
+                "id": i,
+                "method": "eth_sendRawTransaction",
+                "params": [raw_txn.hex()],
+            }
+            for i, raw_txn in enumerate(raw_txns)
+        ]
+        response = orjson.loads(
+            make_post_request(
+                provider.endpoint_uri,
+                orjson.dumps(body),
+                **provider.get_request_kwargs(),
+            )
+        )
+
+        # A batch rejected as a whole gets a single error object back
+        if isinstance(response, dict):
+            raise ValueError(response.get("error", response))
+
+        for item in response:
+            if "error" in item:
+                errors[item["id"]] = item["error"]
+            else:
+                tx_hashes[item["id"]] = HexBytes(item["result"])
+
+        return self.__check_sent(tx_hashes, errors)
+
+    def __check_sent(
+        self, tx_hashes: list[Optional[HexBytes]], errors: dict[int, Any]
+    ) -> list[HexBytes]:
+        # Any transaction without a response is reported as failed too
+        for i, tx_hash in enumerate(tx_hashes):
+            if tx_hash is None and i not in errors:
+                errors[i] = "No response."
+
+        if errors:
+            raise BatchTransactionError(tx_hashes, errors)
+
+        return [tx_hash for tx_hash in tx_hashes if tx_hash is not None]
+
+    def __sign(
+        self,
+        call_data: bytes,
+        gas_limit: int,
+        gas_price: int,
+        nonce: Optional[int] = None,
     ) -> SignedTransaction:
+        if nonce is None:
+            nonce = self.__reserve_nonces()
+
         return self.__operator.sign_transaction(
             {
-                "nonce": self.connector.connection.eth.get_transaction_count(
-                    self.__operator.address
-                ),
+                "nonce": nonce,
                 "from": self.__operator.address,
                 "to": self.address,
                 "data": call_data,
@@ -10,6 +10,8 @@ class FrozenModel(BaseModel):
 
     class Config:
         frozen = True
+        # Frozen instances can be shared, so nesting them needs no copy
+        copy_on_model_validation = False
 
 
 class FrozenGenericModel(GenericModel):
@@ -19,3 +21,5 @@ class FrozenGenericModel(GenericModel):
 
     class Config:
         frozen = True
+        # Frozen instances can be shared, so nesting them needs no copy
+        copy_on_model_validation = False
@@ -1,13 +1,43 @@
 # Standard libraries
 from __future__ import annotations
-from copy import deepcopy
-from typing import TypedDict, Union
+from typing import Iterable, TypedDict, Union
 
 # 3rd party libraries
 from pydantic import BaseModel
 from web3 import Web3
 
 
+# Powers of ten up to the digits of a uint256, looked up instead of recomputed
+POWERS_OF_TEN: tuple[int, ...] = tuple(10**exponent for exponent in range(78))
+
+
+def rescale(value: int, decimals: int, target: int) -> int:
+    """
+    Scales a raw integer value from its decimals to the target decimals.
+
+    NOTE: Value will be rounded when scaling down.
+
+    Args:
+        value: The raw integer value.
+        decimals: The decimals of the value.
+        target: The decimals to scale the value to.
+    Returns:
+        The scaled raw integer value.
+    """
+    # Scale down
+    if decimals >= target:
+        # e.g., (18_888, 3) --> (189, 1)
+        # Single division, rounding half to even as `round` on ints does
+        factor = POWERS_OF_TEN[decimals - target]
+        quotient, remainder = divmod(value, factor)
+        if remainder * 2 > factor or (remainder * 2 == factor and quotient & 1):
+            quotient += 1
+        return quotient
+
+    # Scale up
+    return value * POWERS_OF_TEN[target - decimals]
+
+
 class NumberDict(TypedDict):
     """
     The return type upon calling `.dict()` on the struct.
@@ -39,22 +69,24 @@ class Number(BaseModel):
 
         NOTE: Value will be rounded when scaling down.
         """
-        # Scale down
-        if self.decimals >= target:
-            # e.g., (18_888, 3) --> (189, 1)
-            rounded = round(self.value, target - self.decimals)
-            self.value = rounded // 10 ** (self.decimals - target)
-        # Scale up
-        else:
-            self.value = self.value * 10 ** (target - self.decimals)
-
-        # Update the decimals
+        self.value = rescale(self.value, self.decimals, target)
         self.decimals = target
 
         # Make chainable
         return self
 
-    def __add(self, value: int, decimals: int) -> None:
+    @classmethod
+    def _from_raw(cls, value: int, decimals: int) -> Number:
+        """
+        Builds a number from raw integers already known to be valid,
+        like `construct` but without its defaults handling.
+        """
+        number = cls.__new__(cls)
+        object.__setattr__(number, "__dict__", {"value": value, "decimals": decimals})
+        object.__setattr__(number, "__fields_set__", {"value", "decimals"})
+        return number
+
+    def __add(self, value: int, decimals: int) -> tuple[int, int]:
         """
         Private method to facilitate both addition and subtractions,
         preserving the higher decimals precision of
@@ -62,29 +94,24 @@ class Number(BaseModel):
         """
         if self.decimals >= decimals:
             adjusted_other_value = value * 10 ** (self.decimals - decimals)
-            self.value += adjusted_other_value
-            return
+            return self.value + adjusted_other_value, self.decimals
 
         adjusted_self_value = self.value * 10 ** (decimals - self.decimals)
-        self.value = adjusted_self_value + value
-        self.decimals = decimals
+        return adjusted_self_value + value, decimals
 
     def __add__(self, other: Number) -> Number:
-        copy = self.copy()
-        copy += other
-        return copy
+        # Arithmetic results are built from the raw integers instead of copies
+        return Number._from_raw(*self.__add(other.value, other.decimals))
 
     def __iadd__(self, other: Number) -> Number:
-        self.__add(other.value, other.decimals)
+        self.value, self.decimals = self.__add(other.value, other.decimals)
         return self
 
     def __sub__(self, other: Number) -> Number:
-        copy = self.copy()
-        copy -= other
-        return copy
+        return Number._from_raw(*self.__add(-other.value, other.decimals))
 
     def __isub__(self, other: Number) -> Number:
-        self.__add(-other.value, other.decimals)
+        self.value, self.decimals = self.__add(-other.value, other.decimals)
         return self
 
     def __mul__(self, other: Number) -> Number:
@@ -92,9 +119,9 @@ class Number(BaseModel):
         Multiplies with the other number, preserving the
         current value's decimals precision.
         """
-        copy = self.copy()
-        copy *= other
-        return copy
+        return Number._from_raw(
+            self.value * other.value // 10**other.decimals, self.decimals
+        )
 
     def __imul__(self, other: Number) -> Number:
         """
@@ -109,9 +136,8 @@ class Number(BaseModel):
         Divides with the other value, preserving the
         current value's decimals precision
         """
-        return Number(
-            value=self.value * 10**other.decimals // other.value,
-            decimals=self.decimals,
+        return Number._from_raw(
+            self.value * 10**other.decimals // other.value, self.decimals
         )
 
     def __bool__(self) -> bool:
@@ -121,6 +147,19 @@ class Number(BaseModel):
         result: float = self.value / 10**self.decimals
         return result
 
+    @classmethod
+    def sum(cls, numbers: Iterable[Number]) -> Number:
+        """
+        Sums the numbers in a single pass over their raw integers,
+        equivalent to adding each of them onto `Number()`.
+        """
+        pairs = [(number.value, number.decimals) for number in numbers]
+        target = max([0, *(decimals for _, decimals in pairs)])
+
+        return cls._from_raw(
+            sum(value * 10 ** (target - decimals) for value, decimals in pairs), target
+        )
+
     @classmethod
     def from_wei(self, amount_wei: int) -> Number:
         return Number(value=amount_wei, decimals=18)
@@ -137,12 +176,36 @@ class LongShortNumbers(BaseModel):
     short: Number = Number()
 
     def deepcopy(self) -> LongShortNumbers:
-        return deepcopy(self)
+        # Numbers only hold integers so cloning each of them is a deep copy
+        result: LongShortNumbers = LongShortNumbers.construct(
+            net=Number._from_raw(self.net.value, self.net.decimals),
+            long=Number._from_raw(self.long.value, self.long.decimals),
+            short=Number._from_raw(self.short.value, self.short.decimals),
+        )
+        return result
+
+    @classmethod
+    def sum(cls, items: Iterable[LongShortNumbers]) -> LongShortNumbers:
+        """
+        Sums each of the net, long and short columns in a single pass,
+        equivalent to adding each of them onto `LongShortNumbers()`.
+        """
+        items = list(items)
+        result: LongShortNumbers = cls.construct(
+            net=Number.sum(item.net for item in items),
+            long=Number.sum(item.long for item in items),
+            short=Number.sum(item.short for item in items),
+        )
+        return result
 
     def __add__(self, other: LongShortNumbers) -> LongShortNumbers:
-        copy = self.deepcopy()
-        copy += other
-        return copy
+        # Numbers' adds already return fresh numbers so no validation is needed
+        result: LongShortNumbers = LongShortNumbers.construct(
+            net=self.net + other.net,
+            long=self.long + other.long,
+            short=self.short + other.short,
+        )
+        return result
 
     def __iadd__(self, other: LongShortNumbers) -> LongShortNumbers:
         self.net += other.net
@@ -151,10 +214,10 @@ class LongShortNumbers(BaseModel):
         return self
 
     def broadcast_mul(self, price: Number) -> LongShortNumbers:
-        copy = self.deepcopy()
-        copy.net *= price
-        copy.long *= price
-        copy.short *= price
-
         # Make chainable
-        return copy
+        result: LongShortNumbers = LongShortNumbers.construct(
+            net=self.net * price,
+            long=self.long * price,
+            short=self.short * price,
+        )
+        return result
@@ -25,18 +25,13 @@ class ShortestPathResolver:
         Returns:
             The list of nodes representing the path if exists, otherwise None.
         """
-        if (src, dst) in self.shortest_paths.keys():
-            return self.shortest_paths[(src, dst)]
-
-        if (dst, src) in self.shortest_paths.keys():
-            return self.shortest_paths[(dst, src)]
-
-        return None
+        # Every source is resolved so both directions are already recorded
+        return self.shortest_paths.get((src, dst))
 
     def __resolve(self, edges: Iterable[tuple[str, str]]) -> None:
         """
         Finds all possible shortest paths based on the input edges
-        by first constructing the adjacency list and doing a BFS.
+        by first constructing the adjacency list and doing a BFS from each node.
 
         Args:
             edges: The list of edges (tuples) to use.
@@ -51,28 +46,19 @@ class ShortestPathResolver:
             adj_list[edge[0]].add(edge[1])
             adj_list[edge[1]].add(edge[0])
 
-        # BFS and find the shortest paths
-        queue = deque([[src] for src in nodes])
+        # BFS from every source, extending the path of the node it was reached from
+        for src in nodes:
+            paths = {src: [src]}
+            queue = deque([src])
 
-        while queue:
-            current_path = queue.popleft()
+            while queue:
+                node = queue.popleft()
 
-            # Go through directly reachable nodes from the path's last node
-            for dst in adj_list[current_path[-1]]:
-                # Use each of the node in the currrent path as starting point
-                for i, src in enumerate(current_path):
-                    # Skip if round trip
-                    if src == dst:
+                # Go through directly reachable nodes not visited yet
+                for dst in adj_list[node]:
+                    if dst in paths:
                         continue
 
-                    # Skip if already found
-                    if self.get(src, dst) is not None:
-                        continue
-
-                    # Record if not shortest path found yet
-                    path_found = [*current_path[i:], dst]
-                    self.shortest_paths[(src, dst)] = path_found
-
-                    # Also add it to be visited (only once needed)
-                    if i == 0:
-                        queue.append(path_found)
+                    paths[dst] = [*paths[node], dst]
+                    self.shortest_paths[(src, dst)] = paths[dst]
+                    queue.append(dst)